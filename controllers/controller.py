@@ -222,7 +222,7 @@
 #         return self._job_manager.is_job_running()
 """Controller class for handling UI interactions and data flow."""
 
-from typing import Optional, Dict, Any, Literal
+from typing import Optional, Dict, Any, Iterator, Literal
 import numpy as np
 import plotly.graph_objs as go
 from models.global_session_state import GlobalSessionState
@@ -230,6 +230,7 @@ from models.image_model import ImageModel
 from utils.unit_unificator import UnitUnificator
 from engine.async_job_manager import AsyncJobManager
 from utils.region_handler import RegionHandler
+from utils.region_mask import RegionMask
 
 class Controller:
     """Handles UI interactions and data flow."""
@@ -251,7 +252,7 @@ class Controller:
         self._mode: Literal['mag_phase', 'real_imag'] = 'mag_phase'
 
         # Mask State Persistence
-        self._current_mask: Optional[np.ndarray] = None
+        self._current_mask: Optional[RegionMask] = None
         self._current_rect: Optional[tuple] = None  # (x0, y0, x1, y1)
         self._is_inner_mask: bool = True
 
@@ -276,7 +277,7 @@ class Controller:
                 self._session.remove_image(index)
 
             # Create new ImageModel and load from contents
-            image_model = ImageModel()
+            image_model = ImageModel(precision=self._session.get_precision())
             image_model.load_from_contents(contents)
 
             # Store old shape to detect resize
@@ -285,6 +286,11 @@ class Controller:
             self._session.store_image(index, image_model)
             self._unificator.enforce_unified_size(self._session)
 
+            # Derive all FT components eagerly in one pass per image, so display
+            # and mixing only hit the caches (already prepared images are skipped)
+            for image in self._session.get_all_images():
+                image.prepare_components()
+
             # Check if shape changed
             new_min_shape = self._session.get_min_shape()
             shape_changed = (old_min_shape != new_min_shape)
@@ -306,6 +312,7 @@ class Controller:
                 'ft_component_type': ft_component,
                 'image_shape': image_model.shape,
                 'unified_shape': new_min_shape,
+                'spectrum_shape': self._session.get_fft_shape(),
                 'shape_changed': shape_changed
             }
 
@@ -339,14 +346,23 @@ class Controller:
 
         return {'status': 'success', 'value': val}
 
-    def mix_button_update(self,):
-        self.start_mixing_job()
+    def mix_button_update(self, viewport: Optional[str] = None) -> Optional[str]:
+        return self.start_mixing_job(viewport)
+
+    def start_mixing_job(self, viewport: Optional[str] = None) -> Optional[str]:
+        """
+        Bundles current state and submits it to the Async Job Manager.
 
-    def start_mixing_job(self):
-        """Bundles current state and triggers the Async Job Manager."""
+        Args:
+            viewport: Output viewport the job renders into; a new job for the same
+                      viewport supersedes the previous one, other viewports are unaffected
+
+        Returns:
+            Job ID to poll, or None if there are no images
+        """
         images = self._session.get_all_images()
         if not images:
-            return
+            return None
 
         # Prepare inputs dictionary for the MixerEngine
         inputs = {
@@ -356,13 +372,120 @@ class Controller:
             'images': images,
             'mask': self._current_mask
         }
-        self._job_manager.start_mixing_job(inputs, callback=None)
+        if viewport is None:
+            return self._job_manager.start_mixing_job(inputs, callback=None)
+        return self._job_manager.submit_job(inputs, callback=None, group=viewport)
+
+    def stream_interpolation(self, end_weights1: Dict[int, float], end_weights2: Dict[int, float],
+                             frame_count: int, end_rect: Optional[tuple] = None,
+                             end_is_inner: bool = True) -> Iterator[np.ndarray]:
+        """
+        Yield the frames of a morph from the current weights and mask to new ones.
+
+        Frames are produced lazily by MixerEngine.interpolate_frames, so a
+        script or an animated viewport can render each one as it arrives.
+
+        Args:
+            end_weights1: Component 1 weights at the last frame
+            end_weights2: Component 2 weights at the last frame
+            frame_count: Number of frames (both ends included)
+            end_rect: Optional (x1, y1, x2, y2) mask rectangle at the last frame;
+                      None keeps the current mask throughout
+            end_is_inner: Mode of end_rect
+
+        Returns:
+            Iterator of mixed images (empty if no images are loaded)
+        """
+        images = self._session.get_all_images()
+        if not images:
+            return iter(())
+
+        end_mask = self._current_mask
+        if end_rect is not None:
+            shape = self._session.get_fft_shape()
+            end_mask = RegionHandler().create_region_mask(shape, end_rect, end_is_inner)
+
+        engine = self._job_manager.get_mixer_engine()
+        return engine.interpolate_frames(
+            self._mode,
+            (self._weights_comp1.copy(), self._weights_comp2.copy()),
+            (dict(end_weights1), dict(end_weights2)),
+            images,
+            frame_count,
+            start_mask=self._current_mask,
+            end_mask=end_mask
+        )
 
     def update_mixing_mode(self, mode: str):
         """Updates the mixing mode (mag_phase vs real_imag) and restarts mixing."""
         if mode in ['mag_phase', 'real_imag']:
             self._mode = mode
 
+    def set_fast_length_mode(self, mode: Optional[str]) -> Dict[str, Any]:
+        """
+        Pad or crop the unified shape to fast FFT sizes and re-unify all images.
+
+        Args:
+            mode: None, 'pad' (zero-pad the transform) or 'crop' (shrink the unified shape)
+
+        Returns:
+            Dictionary with status and the new unified/spectrum shapes
+        """
+        try:
+            self._unificator.set_fast_length_mode(mode)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
+
+        self._unificator.enforce_unified_size(self._session)
+
+        # Rebuild the mask for the new spectrum shape
+        if self._current_rect:
+            self.apply_region_mask(self._current_rect, self._is_inner_mask)
+
+        return {
+            'status': 'success',
+            'unified_shape': self._session.get_min_shape(),
+            'spectrum_shape': self._session.get_fft_shape()
+        }
+
+    def set_resize_method(self, method: str) -> Dict[str, Any]:
+        """
+        Choose how images are shrunk to the unified shape.
+
+        Applies to the next resize; images already at the unified shape keep
+        their current pixels.
+
+        Args:
+            method: 'lanczos' (PIL resample + FFT) or 'spectral' (crop of the original spectrum)
+
+        Returns:
+            Dictionary with status
+        """
+        try:
+            self._unificator.set_resize_method(method)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
+
+        return {'status': 'success', 'resize_method': method}
+
+    def set_precision(self, precision: str) -> Dict[str, Any]:
+        """
+        Switch the spectral pipeline between double and single precision.
+
+        Args:
+            precision: 'double' (float64/complex128) or 'single' (float32/complex64)
+
+        Returns:
+            Dictionary with status
+        """
+        try:
+            self._session.set_precision(precision)
+            self._job_manager.set_precision(precision)
+        except ValueError as e:
+            return {'status': 'error', 'message': str(e)}
+
+        return {'status': 'success', 'precision': precision}
+
     def get_plotting_data(self, index: int, mode: Literal['raw', 'magnitude', 'phase', 'real', 'imag'] = 'raw') -> \
     Optional[np.ndarray]:
         """
@@ -403,14 +526,15 @@ class Controller:
         self._current_rect = rect_coords
         self._is_inner_mask = is_inner
 
-        shape = self._session.get_min_shape()
+        # Masks are drawn on the displayed spectra, which have the transform shape
+        shape = self._session.get_fft_shape()
         if shape is None:
             return
 
-        # 2. Use RegionHandler to create the mathematical mask (0s and 1s)
+        # 2. Use RegionHandler to create the mask (rectangle + mode, no dense array)
         handler = RegionHandler()
 
-        self._current_mask = handler.create_mask(shape, rect_coords, is_inner)
+        self._current_mask = handler.create_region_mask(shape, rect_coords, is_inner)
 
     def remove_mask(self):
         """
@@ -449,14 +573,28 @@ class Controller:
         }
 
     # --- Polling Methods for UI Callbacks ---
-    def get_job_progress(self) -> float:
-        """Get the progress of the current background job."""
-        return self._job_manager.get_progress()
-
-    def get_job_result(self):
-        """Get the result of the completed background job."""
-        return self._job_manager.get_result()
-
-    def is_processing(self) -> bool:
-        """Check if a job is currently running."""
-        return self._job_manager.is_job_running()
\ No newline at end of file
+    def get_job_progress(self, job_id: Optional[str] = None) -> float:
+        """Get the progress of a background job (the most recent one if job_id is None)."""
+        if job_id is None:
+            return self._job_manager.get_progress()
+        return self._job_manager.get_job_progress(job_id)
+
+    def get_job_result(self, job_id: Optional[str] = None):
+        """Get the result of a completed background job (the most recent one if job_id is None)."""
+        if job_id is None:
+            return self._job_manager.get_result()
+        return self._job_manager.get_job_result(job_id)
+
+    def get_job_status(self, job_id: str) -> str:
+        """Get a background job's status ('queued', 'running', 'done', 'error', 'cancelled', 'rejected' or 'unknown')."""
+        return self._job_manager.get_job_status(job_id)
+
+    def get_worker_stats(self) -> Dict[str, float]:
+        """Get mixing worker pool saturation metrics (queue depth, backlog, wait and run times)."""
+        return self._job_manager.get_pool_stats()
+
+    def is_processing(self, job_id: Optional[str] = None) -> bool:
+        """Check if a job is currently queued or running (the most recent one if job_id is None)."""
+        if job_id is None:
+            return self._job_manager.is_job_running()
+        return self._job_manager.is_running(job_id)
@@ -2,6 +2,7 @@
 
 from .mixer_engine import MixerEngine
 from .async_job_manager import AsyncJobManager
+from .cancellation import CancellationToken, JobCancelledError
 
-__all__ = ['MixerEngine', 'AsyncJobManager']
+__all__ = ['MixerEngine', 'AsyncJobManager', 'CancellationToken', 'JobCancelledError']
 
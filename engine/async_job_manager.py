@@ -74,102 +74,447 @@
 
 import threading
 import time
-from typing import Dict, Optional, List, Callable, Any
+import uuid
+from collections import deque
+from typing import Dict, Optional, List, Callable, Any, Hashable, Set, Deque, Tuple
 from .mixer_engine import MixerEngine
+from .cancellation import CancellationToken, JobCancelledError
+from .worker_pool import WorkerPool, WorkerPoolFullError, WorkItem
+from .process_mixer import ProcessMixer
+
+
+class _Job:
+    """State of one submitted job."""
+
+    def __init__(self, job_id: str, fingerprint: Hashable):
+        self.job_id = job_id
+        self.fingerprint = fingerprint
+        self.groups: Set[Hashable] = set()
+        self.callbacks: List[Callable] = []
+        self.status = 'queued'  # queued, running, done, error, cancelled or rejected
+        self.progress = 0.0
+        self.result: Optional[Any] = None
+        # The result went to a callback or get_job_result, which may still use it
+        self.delivered = False
+        self.error: Optional[str] = None
+        self.submitted_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+        self.ready_at: Optional[float] = None
+        self.work_item: Optional[WorkItem] = None
+        self.token = CancellationToken()
 
 
 class AsyncJobManager:
-    """Manages asynchronous image mixing jobs."""
+    """
+    Manages asynchronous image mixing jobs.
+
+    Every submission gets a job ID and runs on a persistent WorkerPool;
+    progress and results are kept per ID, so two viewports (or two users)
+    can mix at the same time without overwriting each other. A new job
+    supersedes (cancels) the unfinished job of the same group only;
+    cancellation is cooperative, so a running job stops at the engine's
+    next checkpoint and frees its worker for the new one.
+
+    A finished job keeps its result only while a group still holds it: the
+    next submission of the group drops it, so there is at most one result
+    per viewport, and at most max_results in all (the oldest are dropped
+    first). Finished jobs are forgotten result_ttl seconds after they
+    complete; expired jobs are purged on submission and on status/result
+    queries.
+
+    Bursts are coalesced: a job is queued with a ready time
+    debounce_window seconds ahead (the pool's workers hold it until then;
+    no thread is started per job), so of several submissions from one group in quick
+    succession only the newest runs, and a submission identical to a job
+    still queued or running (same mode, images, weights, mask and
+    precision; see MixerEngine.get_task_key) attaches to that job and gets
+    its ID instead of starting another computation.
+
+    The pool's queue is bounded. When it is full, overflow='queue' keeps
+    the job in a backlog (its status stays 'queued') that is fed to the
+    pool as slots free up; superseded jobs leave the backlog, so it holds
+    at most one job per group. overflow='reject' fails the job at once
+    with status 'rejected'. get_pool_stats() reports queue depth, backlog
+    and wait/run times.
+
+    With execution='process' the pool threads only coordinate: each mix
+    runs in a worker process on spectra published to shared memory (see
+    ProcessMixer), keeping heavy mixes off the interpreter that serves the UI.
+
+    The single-slot methods (start_mixing_job, get_progress, get_result,
+    is_job_running) still work and refer to the most recently started job.
+    """
+
+    _DEFAULT_GROUP = 'default'
+
+    def __init__(self, max_workers: int = 2, result_ttl: float = 300.0, debounce_window: float = 0.05,
+                 max_queue: int = 8, overflow: str = 'queue', execution: str = 'thread',
+                 process_workers: Optional[int] = None, max_results: int = 4):
+        """
+        Initialize AsyncJobManager.
 
-    def __init__(self):
-        """Initialize AsyncJobManager."""
+        Args:
+            max_workers: Jobs that may run at the same time
+            result_ttl: Seconds a finished job's result stays available
+            debounce_window: Seconds a job waits before it starts, during which a
+                             newer submission from its group replaces it (0 disables)
+            max_queue: Jobs that may wait for a worker in the pool queue
+            overflow: What happens to a job when the queue is full: 'queue'
+                      (hold it in the backlog) or 'reject'
+            execution: 'thread' mixes in the pool threads, 'process' in worker processes
+            process_workers: Worker processes for execution='process' (None: one per CPU core)
+            max_results: Finished results kept across all groups
+        """
+        if overflow not in ('queue', 'reject'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if execution not in ('thread', 'process'):
+            raise ValueError(f"Unknown execution mode: {execution}")
         self._mixer_engine = MixerEngine()
-        self._current_job: Optional[threading.Thread] = None
-        self._job_cancelled = False
-        self._progress = 0.0
-        self._result: Optional[any] = None
+        self._process_mixer = ProcessMixer(self._mixer_engine, process_workers) if execution == 'process' else None
+        self._pool = WorkerPool(max_workers, max_queue, on_slot_free=self._drain_backlog, name='mixing-job')
+        self._overflow = overflow
+        self._backlog: Deque[Tuple[_Job, Dict[str, Any]]] = deque()
+        self._result_ttl = result_ttl
+        self._max_results = max_results
+        # Finished jobs holding a result, oldest first
+        self._held_results: Deque[_Job] = deque()
+        self._debounce_window = debounce_window
+        self._jobs: Dict[str, _Job] = {}
+        self._group_jobs: Dict[Hashable, str] = {}
+        self._inflight: Dict[Hashable, str] = {}
+        self._current_job_id: Optional[str] = None
+        self._stats = {'submitted': 0, 'attached': 0, 'skipped': 0, 'interrupted': 0, 'rejected': 0,
+                       'completed': 0, 'failed': 0}
         self._lock = threading.Lock()
 
-    def start_mixing_job(self, inputs: Dict[str, Any], callback: Optional[Callable] = None) -> None:
-        """Start a new image mixing job."""
-        self.cancel_current_job()
+    def submit_job(self, inputs: Dict[str, Any], callback: Optional[Callable] = None,
+                   group: Optional[Hashable] = None) -> str:
+        """
+        Queue a mixing job, or attach to an identical job already in flight.
+
+        Args:
+            inputs: MixerEngine.run_async_task inputs
+            callback: Called with the result (None on error) when the job finishes
+            group: Jobs sharing a group supersede each other (e.g. one per viewport);
+                   None never cancels anything
+
+        Returns:
+            Job ID for polling
+        """
+        fingerprint = self._mixer_engine.get_task_key(inputs)
+        # A group-less submission holds its job with a key nobody else has
+        holder = group if group is not None else object()
 
         with self._lock:
-            self._job_cancelled = False
-            self._progress = 0.0
-            self._result = None
-
-        def job_worker():
-            try:
-                # Define helper to update progress safely
-                def update_progress(val: float):
-                    with self._lock:
-                        # Only update if not cancelled
-                        if not self._job_cancelled:
-                            self._progress = val
-
-                # Start with initial progress
-                update_progress(0.05)
-
-                # Perform mixing, passing the updater
-                result = self._mixer_engine.run_async_task(inputs, progress_callback=update_progress)
-
-                with self._lock:
-                    if self._job_cancelled:
-                        return
-                    self._progress = 1.0
-                    self._result = result
-
-                if callback:
-                    callback(result)
-
-            except Exception as e:
-                print(f"Job Error: {e}")
-                with self._lock:
-                    self._progress = -1.0
-                    self._result = None
-                if callback:
-                    callback(None)
-
-        self._current_job = threading.Thread(target=job_worker, daemon=True)
-        self._current_job.start()
+            self._purge_expired()
+            self._stats['submitted'] += 1
+            superseded = self._group_jobs.get(group) if group is not None else None
 
-    def cancel_current_job(self) -> None:
-        """Cancel the currently running job."""
+            job = self._jobs.get(self._inflight.get(fingerprint))
+            created = job is None
+            if not created:
+                self._stats['attached'] += 1
+                if job.job_id == superseded:
+                    superseded = None
+            else:
+                job = _Job(uuid.uuid4().hex, fingerprint)
+                self._jobs[job.job_id] = job
+                self._inflight[fingerprint] = job.job_id
+
+            job.groups.add(holder)
+            if callback:
+                job.callbacks.append(callback)
+            if group is not None:
+                self._group_jobs[group] = job.job_id
+
+        if superseded is not None:
+            self._release(superseded, group)
+
+        if created:
+            self._dispatch(job, inputs, time.monotonic() + self._debounce_window)
+        return job.job_id
+
+    def _dispatch(self, job: _Job, inputs: Dict[str, Any], ready_at: float) -> None:
+        """Hand a job to the worker pool, to start no earlier than ready_at (the end of its debounce window)."""
         with self._lock:
-            self._job_cancelled = True
+            if job.status != 'queued':
+                return
+            job.ready_at = ready_at
+            # Jobs already held back go first
+            if not self._backlog and self._enqueue(job, inputs):
+                return
+            if self._overflow == 'queue':
+                self._backlog.append((job, inputs))
+                return
+            job.status = 'rejected'
+            job.error = "Too many mixing jobs queued"
+            job.progress = -1.0
+            self._finish(job)
+            self._stats['rejected'] += 1
 
-        if self._current_job and self._current_job.is_alive():
-            # Wait a bit for the thread to finish (optional, prevents zombie threads)
-            self._current_job.join(timeout=0.1)
+        for callback in job.callbacks:
+            callback(None)
+
+    def _enqueue(self, job: _Job, inputs: Dict[str, Any]) -> bool:
+        """Try to put a job on the pool queue (lock held)."""
+        try:
+            job.work_item = self._pool.submit(lambda: self._run_job(job, inputs), ready_at=job.ready_at)
+        except WorkerPoolFullError:
+            return False
+        return True
+
+    def _drain_backlog(self) -> None:
+        """Move held-back jobs onto the pool queue while it has room."""
+        with self._lock:
+            while self._backlog:
+                job, inputs = self._backlog[0]
+                if job.status == 'queued' and not self._enqueue(job, inputs):
+                    return
+                self._backlog.popleft()
+
+    def _release(self, job_id: str, group: Hashable) -> None:
+        """Drop a group's interest in a job; cancel it (or drop its result) when nobody else waits for it."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.groups.discard(group)
+            if job.groups:
+                return
+            self._drop_result(job)
+        self.cancel_job(job_id)
+
+    def _run_job(self, job: _Job, inputs: Dict[str, Any]) -> None:
+        """Worker body: run the engine and record the outcome on the job."""
+        with self._lock:
+            if job.status == 'cancelled':
+                return
+            job.status = 'running'
+            job.progress = 0.05
+
+        # Define helper to update progress safely
+        def update_progress(val: float):
+            with self._lock:
+                # Only update if not cancelled
+                if job.status == 'running':
+                    job.progress = val
+
+        try:
+            runner = self._process_mixer or self._mixer_engine
+            result = runner.run_async_task(inputs, progress_callback=update_progress, cancel_token=job.token)
+        except JobCancelledError:
+            # cancel_job already marked the job; callbacks are not called
+            return
+        except Exception as e:
+            print(f"Job Error: {e}")
+            with self._lock:
+                if job.status != 'running':
+                    return
+                job.status = 'error'
+                job.error = str(e)
+                job.progress = -1.0
+                self._finish(job)
+                self._stats['failed'] += 1
+            for callback in job.callbacks:
+                callback(None)
+            return
+
+        with self._lock:
+            if job.status != 'running':
+                return
+            job.status = 'done'
+            job.progress = 1.0
+            job.result = result
+            job.delivered = bool(job.callbacks)
+            self._finish(job)
+            self._stats['completed'] += 1
+            self._hold_result(job)
+
+        for callback in job.callbacks:
+            callback(result)
+
+    def _finish(self, job: _Job) -> None:
+        """Stamp a job as finished and stop routing identical submissions to it (lock held)."""
+        job.finished_at = time.monotonic()
+        if self._inflight.get(job.fingerprint) == job.job_id:
+            del self._inflight[job.fingerprint]
+
+    def cancel_job(self, job_id: str) -> None:
+        """
+        Cancel a job. A queued job never starts; a running job stops at its next
+        cancellation checkpoint (within one chunk of work).
+
+        Args:
+            job_id: Job to cancel
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status not in ('queued', 'running'):
+                return
+            self._stats['interrupted' if job.status == 'running' else 'skipped'] += 1
+            job.status = 'cancelled'
+            self._finish(job)
+            work_item = job.work_item
+
+        job.token.cancel()
+        if work_item is not None:
+            self._pool.cancel(work_item)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get submission counters.
+
+        Returns:
+            Dictionary with submitted, attached (joined an identical job in flight),
+            skipped (cancelled before starting), interrupted (cancelled while running),
+            rejected (queue full), completed and failed counts
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def get_pool_stats(self) -> Dict[str, float]:
+        """
+        Get worker pool saturation metrics.
+
+        Returns:
+            WorkerPool.get_stats() (workers, busy, queue_depth, wait/run times, ...)
+            plus backlog, the jobs held back because the queue was full
+        """
+        stats = self._pool.get_stats()
+        with self._lock:
+            stats['backlog'] = sum(1 for job, _ in self._backlog if job.status == 'queued')
+        return stats
+
+    def get_job_status(self, job_id: str) -> str:
+        """
+        Get a job's status.
+
+        Returns:
+            'queued', 'running', 'done', 'error', 'cancelled', 'rejected', or 'unknown'
+            (never submitted, or expired)
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            return job.status if job is not None else 'unknown'
+
+    def get_job_progress(self, job_id: str) -> float:
+        """
+        Get a job's progress.
+
+        Returns:
+            Progress value between 0.0 and 1.0, or -1.0 if error or unknown
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job.progress if job is not None else -1.0
+
+    def get_job_result(self, job_id: str) -> Optional[Any]:
+        """
+        Get a finished job's result.
+
+        Returns:
+            Result array if the job completed successfully and its result is
+            still held (its group has not moved on), None otherwise
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job.delivered = job.delivered or job.result is not None
+            return job.result
+
+    def is_running(self, job_id: str) -> bool:
+        """Check whether a job is queued or running."""
+        return self.get_job_status(job_id) in ('queued', 'running')
+
+    def _purge_expired(self) -> None:
+        """Forget jobs that finished more than result_ttl seconds ago (lock held)."""
+        now = time.monotonic()
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and now - job.finished_at > self._result_ttl]
+        for job_id in expired:
+            job = self._jobs.pop(job_id)
+            for group in job.groups:
+                if self._group_jobs.get(group) == job_id:
+                    del self._group_jobs[group]
+            self._drop_result(job)
+
+    def _hold_result(self, job: _Job) -> None:
+        """Keep a finished job's result, dropping the oldest ones beyond max_results (lock held)."""
+        self._held_results = deque(held for held in self._held_results if held.result is not None)
+        self._held_results.append(job)
+        while len(self._held_results) > self._max_results:
+            self._drop_result(self._held_results.popleft())
+
+    def _drop_result(self, job: _Job) -> None:
+        """Forget a job's result (lock held)."""
+        # Nobody outside saw the result, so its buffer can go back to the engine
+        if job.result is not None and not job.delivered:
+            self._mixer_engine.release_result(job.result)
+        job.result = None
+
+    # --- Single-slot interface (most recent job) ---
+    def start_mixing_job(self, inputs: Dict[str, Any], callback: Optional[Callable] = None) -> str:
+        """Start a new image mixing job, superseding the previous one."""
+        job_id = self.submit_job(inputs, callback, group=self._DEFAULT_GROUP)
+        self._current_job_id = job_id
+        return job_id
+
+    def cancel_current_job(self) -> None:
+        """Cancel the most recently started job."""
+        if self._current_job_id is not None:
+            self.cancel_job(self._current_job_id)
+
+    def set_precision(self, precision: str) -> None:
+        """
+        Set the precision used by the underlying MixerEngine for subsequent jobs.
+
+        Args:
+            precision: 'double' or 'single'
+        """
+        self._mixer_engine.set_precision(precision)
+
+    def get_mixer_engine(self) -> MixerEngine:
+        """
+        Get the MixerEngine shared by this manager's jobs (e.g. to stream
+        interpolation frames outside the job queue).
+
+        Returns:
+            MixerEngine instance
+        """
+        return self._mixer_engine
 
     def get_progress(self) -> float:
         """
-        Retrieve the progress of the current job.
+        Retrieve the progress of the most recently started job.
 
         Returns:
             Progress value between 0.0 and 1.0, or -1.0 if error
         """
-        with self._lock:
-            return self._progress
+        if self._current_job_id is None:
+            return 0.0
+        return self.get_job_progress(self._current_job_id)
 
     def get_result(self) -> Optional[any]:
         """
-        Get the result of the completed job.
+        Get the result of the most recently started job.
 
         Returns:
             Result array if job completed successfully, None otherwise
         """
-        with self._lock:
-            return self._result
+        if self._current_job_id is None:
+            return None
+        return self.get_job_result(self._current_job_id)
 
     def is_job_running(self) -> bool:
         """
-        Check if a job is currently running.
+        Check if the most recently started job is still queued or running.
 
         Returns:
             True if job is running, False otherwise
         """
-        if self._current_job is None:
+        if self._current_job_id is None:
             return False
-        return self._current_job.is_alive()
\ No newline at end of file
+        return self.is_running(self._current_job_id)
@@ -0,0 +1,54 @@
+"""CancellationToken class for stopping a running mix cooperatively."""
+
+import threading
+from typing import Optional
+
+
+class JobCancelledError(Exception):
+    """Raised inside a computation whose CancellationToken has been cancelled."""
+
+
+class CancellationToken:
+    """
+    Flag shared between a job's owner and the computation running it.
+
+    Python threads cannot be interrupted, so MixerEngine polls the token
+    between accumulation steps, reconstruction row blocks and inverse FFT
+    chunks, and raises JobCancelledError once it is set. A superseded job
+    therefore stops after at most one chunk of work instead of running to
+    completion. Nothing half-computed is cached: the exception leaves the
+    stage cache before the stage's output is stored.
+    """
+
+    def __init__(self):
+        """Initialize CancellationToken in the not-cancelled state."""
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request cancellation (idempotent, safe from any thread)."""
+        self._event.set()
+
+    def is_cancelled(self) -> bool:
+        """Check whether cancellation was requested."""
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        """
+        Raise if cancellation was requested.
+
+        Raises:
+            JobCancelledError: If cancel() was called
+        """
+        if self._event.is_set():
+            raise JobCancelledError("Job was cancelled")
+
+
+def raise_if_cancelled(token: Optional[CancellationToken]) -> None:
+    """
+    Raise JobCancelledError if an optional token was cancelled.
+
+    Args:
+        token: Token to check, or None (never cancelled)
+    """
+    if token is not None:
+        token.raise_if_cancelled()
@@ -0,0 +1,74 @@
+"""ComponentStack class for holding one FT component of every image as a single tensor."""
+
+import threading
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from models.image_model import ImageModel, PRECISION_DTYPES
+
+
+class ComponentStack:
+    """
+    Keeps each half spectrum component of the session's images as one contiguous
+    (N, H, W // 2 + 1) array, so a mix is a single weighted reduction over the
+    first axis instead of N separate multiply-adds with a temporary each.
+
+    A stack is rebuilt only when an image is replaced, resized or changes
+    precision (tracked through ImageModel.get_version).
+
+    Each layer is filled with ImageModel.fill_half_component, after which
+    the image's cached component is a view of that layer, so a component is
+    held once per session, not once in the image and again in the stack.
+    Only images held at another precision than the stack keep their own copy.
+    """
+
+    def __init__(self):
+        """Initialize ComponentStack with no stacks built."""
+        self._stacks: Dict[str, Tuple[Tuple, np.ndarray]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_key(images: List[Optional[ImageModel]]) -> Tuple:
+        """
+        Build the identity of an image set's contents.
+
+        Args:
+            images: Images in mixing order (None for empty slots)
+
+        Returns:
+            Tuple of image versions (None for empty slots)
+        """
+        return tuple(image.get_version() if image is not None else None for image in images)
+
+    def get(self, images: List[Optional[ImageModel]], component_type: str) -> np.ndarray:
+        """
+        Get the stacked half spectrum component for a set of images.
+
+        Args:
+            images: Images in mixing order (None for empty slots, stacked as zeros)
+            component_type: 'magnitude', 'phase', 'real' or 'imag'
+
+        Returns:
+            Read-only array of shape (N, H, W // 2 + 1)
+        """
+        key = self.get_key(images)
+        with self._lock:
+            cached = self._stacks.get(component_type)
+            if cached is not None and cached[0] == key:
+                return cached[1]
+
+            reference = next(image for image in images if image is not None)
+            dtype = PRECISION_DTYPES[reference.get_precision()][0]
+
+            stack = np.zeros((len(images),) + reference.get_half_shape(), dtype=dtype)
+            for index, image in enumerate(images):
+                if image is not None:
+                    image.fill_half_component(component_type, stack[index])
+            stack.flags.writeable = False
+
+            self._stacks[component_type] = (key, stack)
+            return stack
+
+    def clear(self) -> None:
+        """Drop every stack."""
+        with self._lock:
+            self._stacks.clear()
@@ -1,51 +1,679 @@
+import hashlib
+import threading
+from contextlib import ExitStack
 import numpy as np
-from typing import Dict, Optional, List, Literal, Any, Callable
-from models.image_model import ImageModel
+from typing import Dict, Optional, List, Literal, Any, Callable, Hashable, Iterator, Tuple, Union
+from models.image_model import ImageModel, Precision, PRECISION_DTYPES
+from models.fft_backend import FFTBackend, get_default_backend
+from .component_stack import ComponentStack
+from .stage_cache import StageCache
+from .workspace_pool import WorkspacePool
+from .reconstruction_kernel import ReconstructionKernel, BlockMask, HalfMask
+from .cancellation import CancellationToken, raise_if_cancelled
+from utils.region_mask import RegionMask
+
+# Masks are full, shifted spectrum masks: a RegionMask or a dense array
+Mask = Union[RegionMask, np.ndarray]
 
 
 class MixerEngine:
     """Performs image mixing and reconstruction using Fourier Transform components."""
 
-    def __init__(self):
-        pass
+    # Delta updates applied to a remembered accumulator before it is rebuilt
+    # from scratch, which bounds floating-point drift
+    _MAX_DELTA_STEPS = 16
+
+    # Multiply-adds per output pixel above which the full inverse FFT beats
+    # the pruned transform (measured at 4K: the FFT costs about 200)
+    _PRUNED_MAX_TERMS = 64
+
+    # Complex values per chunk of the cancellable inverse FFT
+    _IFFT_CHUNK_ELEMENTS = 512 * 1024
+
+    # Working memory per chunk of configurations in mix_batch
+    _BATCH_CHUNK_BYTES = 256 * 1024 * 1024
+
+    # Components mixed by each mode (first and second weight group)
+    MODE_COMPONENTS = {'mag_phase': ('magnitude', 'phase'), 'real_imag': ('real', 'imag')}
+
+    def __init__(self, precision: Precision = 'double', fft_backend: Optional[FFTBackend] = None,
+                 kernel: Optional[ReconstructionKernel] = None):
+        """
+        Initialize MixerEngine.
+
+        Args:
+            precision: 'double' runs accumulation and IFFT in float64/complex128,
+                       'single' in float32/complex64 (see PRECISION_DTYPES for the error bound)
+            fft_backend: Backend for the inverse FFT (defaults to the shared backend)
+            kernel: Reconstruction kernel (defaults to one thread per CPU core)
+        """
+        self._fft_backend = fft_backend or get_default_backend()
+        self._component_stack = ComponentStack()
+
+        # Frame-sized buffers reused for accumulators, spectra, outputs and
+        # scratch space; each buffer's owners are counted (see WorkspacePool)
+        self._workspace = WorkspacePool()
+        self._kernel = kernel or ReconstructionKernel()
+
+        # Last accumulator per component: (image set key, weight vector,
+        # read-only accumulator, delta steps since the last full rebuild).
+        # The slot owns its accumulator and releases it when replaced.
+        self._last_accumulators: Dict[str, Tuple[Tuple, np.ndarray, np.ndarray, int]] = {}
+        self._accumulator_lock = threading.Lock()
+
+        # Memoized outputs of each pipeline stage, keyed by their inputs; the
+        # cache owns the buffers it holds and releases them on eviction
+        self._stage_cache = StageCache(retain=self._workspace.retain, release=self._workspace.release)
+
+        # Spatial bases for real/imag mixing: (image set + mask key, real, imag)
+        self._spatial_bases: Optional[Tuple[Tuple, np.ndarray, np.ndarray]] = None
+        self._last_real_imag_key: Optional[Tuple] = None
+
+        self.set_precision(precision)
+
+    def set_precision(self, precision: Precision) -> None:
+        """
+        Set the engine-wide precision used for accumulators and reconstruction.
+
+        Args:
+            precision: 'double' or 'single'
+        """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}")
+        self._precision = precision
+        self._real_dtype, self._complex_dtype = PRECISION_DTYPES[precision]
+        with self._accumulator_lock:
+            accumulators = [entry[2] for entry in self._last_accumulators.values()]
+            self._last_accumulators.clear()
+            self._spatial_bases = None
+            self._last_real_imag_key = None
+        for accumulator in accumulators:
+            self._workspace.release(accumulator)
+        self._stage_cache.clear()
+        self._workspace.clear()
+
+    def get_precision(self) -> Precision:
+        """Get the engine-wide precision."""
+        return self._precision
+
+    def get_stage_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get cache hit/miss counts for each pipeline stage.
+
+        Returns:
+            Dictionary of stage name -> {'hits': int, 'misses': int}
+        """
+        return self._stage_cache.get_stats()
+
+    def get_workspace_stats(self) -> Dict[str, int]:
+        """
+        Get allocation/reuse counts of the workspace buffer pool.
+
+        Returns:
+            Dictionary with idle_buffers, idle_bytes, in_use, allocations and reuses
+        """
+        return self._workspace.get_stats()
+
+    def release_result(self, result: np.ndarray) -> None:
+        """
+        Give back a result returned by run_async_task or mix_images_*.
+
+        Each returned result is owned by its caller. Releasing it lets the
+        engine reuse its buffer for a later mix once the stage cache has
+        dropped it too; a result that is never released is simply garbage
+        collected. The caller must not use the array afterwards.
+
+        Args:
+            result: Array returned by this engine (other arrays are ignored)
+        """
+        self._workspace.release(result)
 
     def run_async_task(self, inputs: Dict[str, Any],
-                       progress_callback: Optional[Callable[[float], None]] = None) -> np.ndarray:
+                       progress_callback: Optional[Callable[[float], None]] = None,
+                       cancel_token: Optional[CancellationToken] = None) -> np.ndarray:
         """
         Entry point for AsyncJobManager. Unpacks inputs and routes to mixing logic.
+        Inputs with a 'configurations' list run as one batch (see mix_batch).
+        Raises JobCancelledError soon after cancel_token is cancelled.
         """
+        if 'configurations' in inputs:
+            return self.mix_batch(
+                mode=inputs.get('mode', 'mag_phase'),
+                configurations=inputs['configurations'],
+                images=inputs.get('images', []),
+                mask=inputs.get('mask'),
+                progress_callback=progress_callback,
+                cancel_token=cancel_token
+            )
         return self.mix_images_unified(
             mode=inputs.get('mode', 'mag_phase'),
             component1_sources=inputs.get('weights1', {}),
             component2_sources=inputs.get('weights2', {}),
             images=inputs.get('images', []),
             mask=inputs.get('mask'),
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            cancel_token=cancel_token
         )
 
-    def _perform_ifft(self, complex_ft: np.ndarray) -> np.ndarray:
+    def get_task_key(self, inputs: Dict[str, Any]) -> Hashable:
+        """
+        Identity of a run_async_task request: equal keys produce equal results.
+
+        Built from the mode, the engine precision, the image versions, the
+        dense weight vectors and the mask's cache key, so it is cheap to
+        compute and stays valid while the images are unchanged.
+
+        Args:
+            inputs: run_async_task inputs
+
+        Returns:
+            Hashable key
+        """
+        images = inputs.get('images', [])
+        count = len(images)
+        if 'configurations' in inputs:
+            weights = tuple((self._weights_key(first, count), self._weights_key(second, count))
+                            for first, second in inputs['configurations'])
+        else:
+            weights = (self._weights_key(inputs.get('weights1', {}), count),
+                       self._weights_key(inputs.get('weights2', {}), count))
+        return (inputs.get('mode', 'mag_phase'), 'configurations' in inputs, self._precision,
+                ComponentStack.get_key(images), weights, self.get_mask_key(inputs.get('mask')))
+
+    def get_half_mask(self, mask: Optional[Mask], fft_shape: Tuple[int, int]) -> Optional[HalfMask]:
+        """
+        Half spectrum form of a mask, as the mixing paths apply it.
+
+        Args:
+            mask: Full, shifted spectrum mask (or None)
+            fft_shape: Transform shape of the images being mixed
+
+        Returns:
+            Block mask or read-only dense array, or None when the mask is
+            missing, selects everything or was drawn for another shape
+        """
+        mask = self._usable_mask(mask, fft_shape)
+        return self._get_half_mask(mask) if mask is not None else None
+
+    def mix_stacks(
+            self,
+            mode: Literal['mag_phase', 'real_imag'],
+            weights: Tuple[np.ndarray, np.ndarray],
+            stacks: Tuple[np.ndarray, np.ndarray],
+            stack_keys: Tuple[Hashable, Hashable],
+            fft_shape: Tuple[int, int],
+            shape: Tuple[int, int],
+            half_mask: Optional[HalfMask] = None,
+            out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Mix half spectrum components that are already stacked, without ImageModels.
+
+        This is what a process-pool worker runs on the stacks it maps from
+        shared memory (see ProcessMixer). Results bypass the stage cache, but
+        the accumulators still take delta updates between calls with the
+        same stack keys.
+
+        Args:
+            mode: 'mag_phase' or 'real_imag'
+            weights: Dense weight vector per component group
+            stacks: (N, H, W // 2 + 1) stack per component group (see MODE_COMPONENTS)
+            stack_keys: Identity of each stack's contents
+            fft_shape: Transform shape (H, W)
+            shape: Visible output shape
+            half_mask: Optional half spectrum mask (see get_half_mask)
+            out: Optional real array of shape `shape` to write the result into
+
+        Returns:
+            Clipped image (out, if given)
+        """
+        if mode not in self.MODE_COMPONENTS:
+            raise ValueError(f"Unknown mode: {mode}")
+
+        with ExitStack() as owned:
+            reduced = []
+            for component_type, stack, key, group_weights in zip(self.MODE_COMPONENTS[mode], stacks,
+                                                                 stack_keys, weights):
+                accumulator = self._reduce(component_type, stack, key, np.asarray(group_weights, dtype=stack.dtype))
+                owned.callback(self._workspace.release, accumulator)
+                reduced.append(accumulator)
+
+            combine = self._kernel.polar_to_complex if mode == 'mag_phase' else self._kernel.cartesian_to_complex
+            with self._workspace.borrow(reduced[0].shape, self._complex_dtype) as spectrum:
+                combine(reduced[0], reduced[1], spectrum, half_mask)
+                result = self._perform_ifft(spectrum, fft_shape, shape, self._mask_support(half_mask))
+
+        if out is None:
+            return result
+        np.copyto(out, result, casting='same_kind')
+        self._workspace.release(result)
+        return out
+
+    def _perform_ifft(self, half_ft: np.ndarray, fft_shape: Tuple[int, int],
+                      shape: Tuple[int, int], support: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+                      cancel_token: Optional[CancellationToken] = None) -> np.ndarray:
         """
         Centralized IFFT method:
-        - Undo shift (ifftshift)
-        - Compute inverse FFT
+        - Take the unshifted half spectrum (rfft2 layout)
+        - Compute the real inverse FFT (irfft2) at the transform shape,
+          or only from the nonzero support when it is small
+        - Crop fast-length padding back to the visible shape
         - Return real clipped image
+        With a cancel_token the full transform runs in chunks (see _chunked_irfft2).
         """
-        # Undo shift applied to FFT before masking
-        unshifted_ft = np.fft.ifftshift(complex_ft)
+        raise_if_cancelled(cancel_token)
+        if support is not None and self._pruned_terms(support, fft_shape) <= self._PRUNED_MAX_TERMS:
+            result = self._pruned_irfft2(half_ft, support, fft_shape, shape)
+            return np.clip(result, 0, 255, out=result)
+
+        if cancel_token is not None:
+            result = self._chunked_irfft2(half_ft, fft_shape, shape, cancel_token)
+            return np.clip(result, 0, 255, out=result)
+
+        # irfft2 implies the missing half from Hermitian symmetry, so the output
+        # is real without computing (and discarding) an imaginary part.
+        # pocketfft allocates its own output; when it already has the visible
+        # shape and dtype, clip it in place instead of copying.
+        result = self._fft_backend.irfft2(half_ft, s=fft_shape)
+        if result.shape == tuple(shape) and result.dtype == self._real_dtype:
+            return np.clip(result, 0, 255, out=result)
+        # numpy < 2.0 always promotes to float64; the clip casts into the pooled output
+        clipped = self._workspace.acquire(tuple(shape), self._real_dtype)
+        return np.clip(result[:shape[0], :shape[1]], 0, 255, out=clipped)
+
+    def _chunked_irfft2(self, half_ft: np.ndarray, fft_shape: Tuple[int, int], shape: Tuple[int, int],
+                        cancel_token: CancellationToken) -> np.ndarray:
+        """
+        irfft2 as its two 1D passes, each split into chunks with a cancellation check between them.
+
+        The column pass (complex ifft along axis 0) runs over blocks of
+        columns and keeps only the visible rows; the row pass (irfft along
+        axis 1) then runs over blocks of those rows. Cancellation latency is
+        one chunk of about _IFFT_CHUNK_ELEMENTS values.
+
+        Args:
+            half_ft: Complex half spectrum of shape (H, W // 2 + 1)
+            fft_shape: Transform shape (H, W)
+            shape: Visible output shape
+            cancel_token: Token checked before each chunk
 
-        # Inverse FFT
-        result = np.fft.ifft2(unshifted_ft)
-        result = np.real(result)
-        result = np.clip(result, 0, 255)
+        Returns:
+            Real array of shape `shape` (pooled buffer, unclipped)
+        """
+        height, width = fft_shape
+        half_width = half_ft.shape[1]
+        result = self._workspace.acquire(tuple(shape), self._real_dtype)
+
+        with self._workspace.borrow((shape[0], half_width), self._complex_dtype) as columns:
+            column_chunk = max(1, self._IFFT_CHUNK_ELEMENTS // height)
+            for start in range(0, half_width, column_chunk):
+                cancel_token.raise_if_cancelled()
+                stop = min(start + column_chunk, half_width)
+                columns[:, start:stop] = self._fft_backend.ifft(half_ft[:, start:stop], n=height, axis=0)[:shape[0]]
+
+            row_chunk = max(1, self._IFFT_CHUNK_ELEMENTS // half_width)
+            for start in range(0, shape[0], row_chunk):
+                cancel_token.raise_if_cancelled()
+                stop = min(start + row_chunk, shape[0])
+                result[start:stop] = self._fft_backend.irfft(columns[start:stop], n=width, axis=1)[:, :shape[1]]
         return result
 
+    @staticmethod
+    def _pruned_terms(support: Tuple[np.ndarray, np.ndarray], fft_shape: Tuple[int, int]) -> float:
+        """Multiply-adds per output pixel of _pruned_irfft2 for a support."""
+        rows, cols = support
+        return 2 * len(cols) + 2 * len(rows) * len(cols) / fft_shape[1]
+
+    def _pruned_irfft2(self, half_ft: np.ndarray, support: Tuple[np.ndarray, np.ndarray],
+                       fft_shape: Tuple[int, int], shape: Tuple[int, int]) -> np.ndarray:
+        """
+        irfft2 of a half spectrum that is zero outside support rows x support columns.
+
+        The inverse DFT is separable, so with r support rows and c support
+        columns the visible output is
+            x = Re(A @ X[rows, cols] @ B),
+        A[y, i] = exp(2j*pi*rows[i]*y/H) / H and
+        B[i, w] = weight[i] * exp(2j*pi*cols[i]*w/W) / W, where weight is 2
+        for columns standing in for their Hermitian mirror and 1 for DC and
+        Nyquist. Its real part is one real (h, 2c) @ (2c, w) product. For a
+        low-pass selection c is a few dozen at most, which costs far less per
+        pixel than a full-size FFT. Only the visible rows and columns are
+        synthesized, so padding needs no crop.
+
+        Args:
+            half_ft: Complex half spectrum of shape (H, W // 2 + 1)
+            support: (row indices, column indices) outside of which half_ft is zero
+            fft_shape: Transform shape (H, W)
+            shape: Visible output shape
+
+        Returns:
+            Real array of shape `shape` (pooled buffer, unclipped)
+        """
+        height, width = fft_shape
+        rows, cols = support
+
+        synthesis_rows = np.exp((2j * np.pi / height) * np.outer(np.arange(shape[0]), rows)) / height
+        partial = synthesis_rows @ half_ft[np.ix_(rows, cols)]
+
+        weight = np.where((cols == 0) | ((width % 2 == 0) & (cols == width // 2)), 1.0, 2.0) / width
+        synthesis_cols = weight[:, None] * np.exp((2j * np.pi / width) * np.outer(cols, np.arange(shape[1])))
+
+        # Re(P @ B) = P.real @ B.real - P.imag @ B.imag as a single product
+        left = np.concatenate([partial.real, -partial.imag], axis=1).astype(self._real_dtype)
+        right = np.concatenate([synthesis_cols.real, synthesis_cols.imag], axis=0).astype(self._real_dtype)
+        result = self._workspace.acquire(tuple(shape), self._real_dtype)
+        return np.dot(left, right, out=result)
+
+    @staticmethod
+    def _mask_support(half_mask: Optional[HalfMask]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Rows and columns outside of which a masked half spectrum is zero.
+
+        Returns:
+            (row indices, column indices) for a block mask on a zero
+            background (an inner rectangle), otherwise None
+        """
+        if half_mask is None or isinstance(half_mask, np.ndarray) or half_mask[0] != 0:
+            return None
+        blocks = half_mask[1]
+        rows = np.unique(np.concatenate([np.arange(block[0].start, block[0].stop) for block in blocks] or [[]]))
+        cols = np.unique(np.concatenate([np.arange(block[1].start, block[1].stop) for block in blocks] or [[]]))
+        return rows.astype(np.intp), cols.astype(np.intp)
+
+    def _accumulate(self, images: List[ImageModel], sources: Dict[int, float],
+                    component_type: str, cancel_token: Optional[CancellationToken] = None) -> Tuple[Tuple, np.ndarray]:
+        """
+        Weighted sum of one half spectrum component over all images (memoized stage).
+
+        Args:
+            images: Images in mixing order
+            sources: Weight per image index (missing indices weigh 0)
+            component_type: Component to mix
+            cancel_token: Optional token checked between reduction steps
+
+        Returns:
+            Tuple of (stage key, read-only accumulator of shape (H, W // 2 + 1));
+            the caller owns a reference and must release it to the workspace pool
+        """
+        images_key = ComponentStack.get_key(images)
+        stage_key = (component_type, images_key, self._weights_key(sources, len(images)))
+
+        def compute() -> np.ndarray:
+            stack = self._component_stack.get(images, component_type)
+            weights = self._weight_vector(sources, len(images), stack.dtype)
+            return self._reduce(component_type, stack, images_key, weights, cancel_token)
+
+        return stage_key, self._stage_cache.get_or_compute(component_type, stage_key, compute)
+
+    def _reduce(self, slot: str, stack: np.ndarray, key: Tuple, weights: np.ndarray,
+                cancel_token: Optional[CancellationToken] = None) -> np.ndarray:
+        """
+        Contract a weight vector with an (N, ...) stack, reusing the previous result.
+
+        If the previous reduction in this slot used the same stack (same key)
+        and only some weights changed, the remembered result is updated with
+        (new - old) * layer for just those layers: a slider tweak costs one
+        frame-sized multiply-add instead of N. Otherwise the weights are
+        contracted with the stack in a single BLAS gemv pass.
+
+        Args:
+            slot: Name of the remembered result (one per component or basis)
+            stack: Read-only (N, ...) array of layers
+            key: Identity of the stack contents
+            weights: Weight per layer
+            cancel_token: Optional token checked before the contraction and between delta layers
+
+        Returns:
+            Read-only weighted sum; callers must not mutate it and must
+            release their reference to the workspace pool
+        """
+        with self._accumulator_lock:
+            last = self._last_accumulators.get(slot)
+            if last is not None and last[0] == key:
+                # Own the previous result while reading it: another job may replace it
+                self._workspace.retain(last[2])
+            else:
+                last = None
+
+        mixed = None
+        steps = 0
+        if last is not None:
+            _, last_weights, last_mixed, last_steps = last
+            changed = np.flatnonzero(weights != last_weights)
+            if changed.size == 0:
+                # The reference taken above becomes the caller's
+                return last_mixed
+            try:
+                if changed.size < len(weights) and last_steps < self._MAX_DELTA_STEPS:
+                    mixed = self._delta_update(stack, weights, last_weights, last_mixed, changed, cancel_token)
+                    steps = last_steps + 1
+            finally:
+                self._workspace.release(last_mixed)
+
+        if mixed is None:
+            raise_if_cancelled(cancel_token)
+            mixed = self._workspace.acquire(stack.shape[1:], self._real_dtype)
+            if stack.dtype == self._real_dtype:
+                np.dot(weights, stack.reshape(len(weights), -1), out=mixed.reshape(-1))
+            else:
+                # Images held at a different precision than the engine
+                np.copyto(mixed, np.tensordot(weights, stack, axes=1), casting='same_kind')
+
+        mixed.flags.writeable = False
+        # One reference for the slot, one for the caller
+        self._workspace.retain(mixed)
+        with self._accumulator_lock:
+            previous = self._last_accumulators.get(slot)
+            self._last_accumulators[slot] = (key, weights, mixed, steps)
+        if previous is not None:
+            self._workspace.release(previous[2])
+        return mixed
+
+    def _delta_update(self, stack: np.ndarray, weights: np.ndarray, last_weights: np.ndarray,
+                      last_mixed: np.ndarray, changed: np.ndarray,
+                      cancel_token: Optional[CancellationToken] = None) -> np.ndarray:
+        """
+        last_mixed plus (new - old) * layer for the changed layers, in a new pooled buffer.
+
+        Writes into a new buffer rather than updating in place: a concurrent
+        job may still be reading the previous accumulator.
+        """
+        mixed = self._workspace.acquire(stack.shape[1:], self._real_dtype)
+        try:
+            np.multiply(stack[changed[0]], weights[changed[0]] - last_weights[changed[0]], out=mixed)
+            mixed += last_mixed
+            if changed.size > 1:
+                with self._workspace.borrow(stack.shape[1:], self._real_dtype) as scratch:
+                    for idx in changed[1:]:
+                        raise_if_cancelled(cancel_token)
+                        np.multiply(stack[idx], weights[idx] - last_weights[idx], out=scratch)
+                        mixed += scratch
+        except BaseException:
+            self._workspace.release(mixed)
+            raise
+        return mixed
+
+    @classmethod
+    def _weights_key(cls, sources: Dict[int, float], count: int) -> Tuple[float, ...]:
+        """Hashable identity of a weight group."""
+        return tuple(cls._weight_vector(sources, count, np.float64).tolist())
+
+    @staticmethod
+    def _freeze(array: np.ndarray) -> np.ndarray:
+        """Mark a stage output read-only so it can be shared between mixes."""
+        array.flags.writeable = False
+        return array
+
+    @staticmethod
+    def get_mask_key(mask: Optional[Mask]) -> Optional[Tuple]:
+        """Identity of a mask's contents (None for no mask)."""
+        if mask is None:
+            return None
+        if isinstance(mask, RegionMask):
+            return mask.cache_key()
+        return (mask.shape, hashlib.blake2b(np.ascontiguousarray(mask).tobytes(), digest_size=16).digest())
+
+    @staticmethod
+    def _usable_mask(mask: Optional[Mask], fft_shape: Tuple[int, int]) -> Optional[Mask]:
+        """Drop masks drawn for another transform shape and masks that select everything."""
+        if mask is None or tuple(mask.shape) != tuple(fft_shape):
+            return None
+        if isinstance(mask, RegionMask) and mask.selects_everything():
+            return None
+        return mask
+
+    def _get_spatial_bases(self, images: List[ImageModel], mask: Optional[Mask],
+                           fft_shape: Tuple[int, int], shape: Tuple[int, int],
+                           build: bool = False,
+                           cancel_token: Optional[CancellationToken] = None) -> Optional[Tuple[Tuple, np.ndarray, np.ndarray]]:
+        """
+        Per-image spatial bases for real/imag mixing under a fixed mask.
+
+        Real/imag mixing is linear in the weights, so
+        IFFT(M * (sum w_i R_i + j sum v_i I_i)) = sum w_i IFFT(M R_i) + sum v_i IFFT(j M I_i).
+        With both sets of bases cached, a mix is a weighted sum of spatial
+        frames plus the final clip, with no inverse FFT.
+
+        Building costs 2N inverse FFTs, so the bases are only built the second
+        time the same images and mask are mixed (or right away with build=True);
+        the first mix takes the spectral path. cancel_token is checked
+        before each basis; a cancelled build caches nothing.
+
+        Returns:
+            Tuple of (key, real bases, imag bases), each (N, H, W) read-only, or None
+        """
+        key = (ComponentStack.get_key(images), self.get_mask_key(mask))
+
+        with self._accumulator_lock:
+            cached = self._spatial_bases
+            if cached is not None and cached[0] == key:
+                return cached
+            seen_before = self._last_real_imag_key == key
+            self._last_real_imag_key = key
+
+        if not seen_before and not build:
+            return None
+
+        half_mask = self._get_half_mask(mask) if mask is not None else None
+        bases = []
+        for component_type in ('real', 'imag'):
+            stack = self._component_stack.get(images, component_type)
+            zeros = np.zeros(stack.shape[1:], dtype=stack.dtype)
+            half_ft = np.empty(stack.shape[1:], dtype=self._complex_dtype)
+            layers = np.empty((len(images),) + tuple(shape), dtype=self._real_dtype)
+            for index in range(len(images)):
+                raise_if_cancelled(cancel_token)
+                if component_type == 'real':
+                    self._kernel.cartesian_to_complex(stack[index], zeros, half_ft, half_mask)
+                else:
+                    self._kernel.cartesian_to_complex(zeros, stack[index], half_ft, half_mask)
+                spatial = self._fft_backend.irfft2(half_ft, s=fft_shape)
+                layers[index] = spatial[:shape[0], :shape[1]]
+            layers.flags.writeable = False
+            bases.append(layers)
+
+        cached = (key, bases[0], bases[1])
+        with self._accumulator_lock:
+            self._spatial_bases = cached
+        return cached
+
+    @staticmethod
+    def _weight_vector(sources: Dict[int, float], count: int, dtype: np.dtype) -> np.ndarray:
+        """Turn an index -> weight dict into a dense weight vector of length count."""
+        weights = np.zeros(count, dtype=dtype)
+        for idx, weight in sources.items():
+            if 0 <= idx < count:
+                weights[idx] = weight
+        return weights
+
+    def _get_half_mask(self, mask: Mask) -> HalfMask:
+        """Half spectrum form of a mask (memoized stage)."""
+        return self._stage_cache.get_or_compute(
+            'half_mask', (self.get_mask_key(mask), self._precision), lambda: self._to_half_mask(mask))
+
+    def _to_half_mask(self, mask: Mask) -> HalfMask:
+        """
+        Convert a full, shifted mask to the half spectrum layout.
+
+        Rectangles become a block mask (see _rect_to_half_blocks); other
+        masks become a dense read-only array.
+
+        The full path took the real part of ifft2(mask * X). For a real image's
+        spectrum X that equals ifft2 of the Hermitian part of mask * X, which is
+        X scaled by the symmetrized mask (mask(k) + mask(-k)) / 2. Symmetrizing
+        first keeps rectangles that are off-center exact under irfft2.
+
+        Args:
+            mask: Full mask of shape (H, W) with the DC term at the center
+
+        Returns:
+            Symmetrized mask of shape (H, W // 2 + 1), unshifted
+        """
+        if isinstance(mask, RegionMask):
+            if mask.get_rect_slices() is not None:
+                return self._rect_to_half_blocks(mask)
+            mask = mask.to_dense(self._real_dtype)
+
+        height, width = mask.shape
+        half_width = width // 2 + 1
+
+        unshifted = np.fft.ifftshift(mask)
+        rows = (-np.arange(height)) % height
+        cols = (-np.arange(half_width)) % width
+        mirrored = unshifted[np.ix_(rows, cols)]
+
+        half_mask = unshifted[:, :half_width] + mirrored
+        half_mask *= 0.5
+        return self._freeze(half_mask.astype(self._real_dtype, copy=False))
+
+    @staticmethod
+    def _rect_to_half_blocks(mask: RegionMask) -> BlockMask:
+        """
+        Symmetrized half spectrum form of a rectangle mask, as disjoint blocks.
+
+        The rectangle R and its mirror -R are separable, so each is an outer
+        product of a row and a column indicator. Cutting the half spectrum
+        wherever either indicator changes gives a grid whose cells are
+        constant: 1 in R and -R, 0.5 in only one of them, 0 elsewhere
+        (inverted for an outer mask). Only the cells that differ from the
+        background are returned.
+        """
+        height, width = mask.shape
+        half_width = width // 2 + 1
+        row_slice, col_slice = mask.get_rect_slices()
+
+        rows = np.zeros(height, dtype=bool)
+        rows[row_slice] = True
+        cols = np.zeros(width, dtype=bool)
+        cols[col_slice] = True
+        rows, cols = np.fft.ifftshift(rows), np.fft.ifftshift(cols)
+
+        mirrored_rows = rows[(-np.arange(height)) % height]
+        mirrored_cols = cols[(-np.arange(half_width)) % width]
+        cols = cols[:half_width]
+
+        def edges(direct: np.ndarray, mirrored: np.ndarray) -> List[int]:
+            changes = (direct[1:] != direct[:-1]) | (mirrored[1:] != mirrored[:-1])
+            return [0] + (np.flatnonzero(changes) + 1).tolist() + [len(direct)]
+
+        row_edges, col_edges = edges(rows, mirrored_rows), edges(cols, mirrored_cols)
+        blocks = []
+        for top, bottom in zip(row_edges[:-1], row_edges[1:]):
+            for left, right in zip(col_edges[:-1], col_edges[1:]):
+                value = 0.5 * (rows[top] and cols[left]) + 0.5 * (mirrored_rows[top] and mirrored_cols[left])
+                if value:
+                    blocks.append((slice(top, bottom), slice(left, right),
+                                   value if mask.is_inner() else 1.0 - value))
+        return (0.0 if mask.is_inner() else 1.0, blocks)
+
     def mix_images_mag_phase(
             self,
             magnitude_sources: Dict[int, float],
             phase_sources: Dict[int, float],
             images: List[ImageModel],
-            mask: Optional[np.ndarray] = None,
-            progress_callback: Optional[Callable[[float], None]] = None
+            mask: Optional[Mask] = None,
+            progress_callback: Optional[Callable[[float], None]] = None,
+            cancel_token: Optional[CancellationToken] = None
     ) -> np.ndarray:
         if not images:
             raise ValueError("No images provided")
@@ -54,39 +682,43 @@ class MixerEngine:
         if progress_callback: progress_callback(0.1)
 
         shape = images[0].shape
+        fft_shape = images[0].get_fft_shape()
+        mask = self._usable_mask(mask, fft_shape)
 
-        # 1. Mix Magnitudes - Direct multiplication without normalization
-        mixed_magnitude = np.zeros(shape, dtype=np.float64)
-
-        for idx, weight in magnitude_sources.items():
-            if idx < len(images) and images[idx] is not None and weight != 0:
-                mixed_magnitude += images[idx].get_data('magnitude') * weight
+        with ExitStack() as owned:
+            # 1. Mix Magnitudes - Direct multiplication without normalization
+            magnitude_key, mixed_magnitude = self._accumulate(images, magnitude_sources, 'magnitude', cancel_token)
+            owned.callback(self._workspace.release, mixed_magnitude)
 
-        # Report: Magnitude Done
-        if progress_callback: progress_callback(0.4)
+            # Report: Magnitude Done
+            if progress_callback: progress_callback(0.4)
 
-        # 2. Mix Phases - Direct multiplication without normalization
-        mixed_phase = np.zeros(shape, dtype=np.float64)
+            # 2. Mix Phases - Direct multiplication without normalization
+            phase_key, mixed_phase = self._accumulate(images, phase_sources, 'phase', cancel_token)
+            owned.callback(self._workspace.release, mixed_phase)
 
-        for idx, weight in phase_sources.items():
-            if idx < len(images) and images[idx] is not None and weight != 0:
-                mixed_phase += images[idx].get_data('phase') * weight
+            # Report: Phase Done
+            if progress_callback: progress_callback(0.7)
 
-        # Report: Phase Done
-        if progress_callback: progress_callback(0.7)
+            # 3. Apply Mask (folded into the polar-to-complex pass)
+            half_mask = None
+            if mask is not None:
+                mask_key = self.get_mask_key(mask)
+                half_mask = self._get_half_mask(mask)
+                magnitude_key = (magnitude_key, mask_key)
 
-        # 3. Apply Mask
-        if mask is not None:
-            if mask.shape == shape:
-                mixed_magnitude *= mask
+            # 4. Reconstruct & IFFT; the spectrum is only needed until the transform
+            def reconstruct() -> np.ndarray:
+                with self._workspace.borrow(mixed_phase.shape, self._complex_dtype) as complex_ft:
+                    self._kernel.polar_to_complex(mixed_magnitude, mixed_phase, complex_ft, half_mask, cancel_token)
+                    return self._freeze(self._perform_ifft(complex_ft, fft_shape, shape,
+                                                           self._mask_support(half_mask), cancel_token))
 
-        # 4. Reconstruct & IFFT
-        complex_ft = mixed_magnitude * np.exp(1j * mixed_phase)
+            # Report: Calculating IFFT
+            if progress_callback: progress_callback(0.85)
 
-        # Report: Calculating IFFT
-        if progress_callback: progress_callback(0.85)
-
-        result = self._perform_ifft(complex_ft)
+            result = self._stage_cache.get_or_compute('ifft', ((magnitude_key, phase_key), fft_shape, shape),
+                                                      reconstruct)
 
         # Report: Almost Done
         if progress_callback: progress_callback(0.95)
@@ -98,41 +730,75 @@ class MixerEngine:
             real_sources: Dict[int, float],
             imag_sources: Dict[int, float],
             images: List[ImageModel],
-            mask: Optional[np.ndarray] = None,
-            progress_callback: Optional[Callable[[float], None]] = None
+            mask: Optional[Mask] = None,
+            progress_callback: Optional[Callable[[float], None]] = None,
+            cancel_token: Optional[CancellationToken] = None
     ) -> np.ndarray:
         if not images:
             raise ValueError("No images provided")
 
         if progress_callback: progress_callback(0.1)
         shape = images[0].shape
+        fft_shape = images[0].get_fft_shape()
+        mask = self._usable_mask(mask, fft_shape)
+
+        # Repeated mix with the same images and mask: weighted sum of cached
+        # spatial bases, no inverse FFT
+        bases = self._get_spatial_bases(images, mask, fft_shape, shape, cancel_token=cancel_token)
+        if bases is not None:
+            key, real_bases, imag_bases = bases
+            spatial_key = (key, self._weights_key(real_sources, len(images)),
+                           self._weights_key(imag_sources, len(images)))
+
+            def combine_bases() -> np.ndarray:
+                with ExitStack() as owned:
+                    spatial_real = self._reduce('basis_real', real_bases, key,
+                                                self._weight_vector(real_sources, len(images), real_bases.dtype),
+                                                cancel_token)
+                    owned.callback(self._workspace.release, spatial_real)
+                    if progress_callback: progress_callback(0.5)
+                    spatial_imag = self._reduce('basis_imag', imag_bases, key,
+                                                self._weight_vector(imag_sources, len(images), imag_bases.dtype),
+                                                cancel_token)
+                    owned.callback(self._workspace.release, spatial_imag)
+                    spatial = self._workspace.acquire(spatial_real.shape, self._real_dtype)
+                    np.add(spatial_real, spatial_imag, out=spatial)
+                return self._freeze(np.clip(spatial, 0, 255, out=spatial))
 
-        # Mix Real - Direct multiplication without normalization
-        mixed_real = np.zeros(shape, dtype=np.float64)
-        for idx, weight in real_sources.items():
-            if idx < len(images) and images[idx] is not None and weight != 0:
-                mixed_real += images[idx].get_data('real') * weight
+            result = self._stage_cache.get_or_compute('spatial', spatial_key, combine_bases)
+            if progress_callback: progress_callback(0.85)
+            return result
 
-        if progress_callback: progress_callback(0.4)
+        with ExitStack() as owned:
+            # Mix Real - Direct multiplication without normalization
+            real_key, mixed_real = self._accumulate(images, real_sources, 'real', cancel_token)
+            owned.callback(self._workspace.release, mixed_real)
 
-        # Mix Imag - Direct multiplication without normalization
-        mixed_imag = np.zeros(shape, dtype=np.float64)
-        for idx, weight in imag_sources.items():
-            if idx < len(images) and images[idx] is not None and weight != 0:
-                mixed_imag += images[idx].get_data('imag') * weight
+            if progress_callback: progress_callback(0.4)
 
-        if progress_callback: progress_callback(0.7)
+            # Mix Imag - Direct multiplication without normalization
+            imag_key, mixed_imag = self._accumulate(images, imag_sources, 'imag', cancel_token)
+            owned.callback(self._workspace.release, mixed_imag)
 
-        # Apply Mask
-        if mask is not None and mask.shape == shape:
-            mixed_real *= mask
-            mixed_imag *= mask
+            if progress_callback: progress_callback(0.7)
 
-        complex_ft = mixed_real + 1j * mixed_imag
+            # Apply Mask (folded into the combine pass)
+            half_mask = None
+            if mask is not None:
+                mask_key = self.get_mask_key(mask)
+                half_mask = self._get_half_mask(mask)
+                real_key, imag_key = (real_key, mask_key), (imag_key, mask_key)
 
-        if progress_callback: progress_callback(0.85)
+            # The spectrum is only needed until the transform
+            def reconstruct() -> np.ndarray:
+                with self._workspace.borrow(mixed_real.shape, self._complex_dtype) as complex_ft:
+                    self._kernel.cartesian_to_complex(mixed_real, mixed_imag, complex_ft, half_mask, cancel_token)
+                    return self._freeze(self._perform_ifft(complex_ft, fft_shape, shape,
+                                                           self._mask_support(half_mask), cancel_token))
 
-        return self._perform_ifft(complex_ft)
+            if progress_callback: progress_callback(0.85)
+
+            return self._stage_cache.get_or_compute('ifft', ((real_key, imag_key), fft_shape, shape), reconstruct)
 
     def mix_images_unified(
             self,
@@ -140,16 +806,309 @@ class MixerEngine:
             component1_sources: Dict[int, float],
             component2_sources: Dict[int, float],
             images: List[ImageModel],
-            mask: Optional[np.ndarray] = None,
-            progress_callback: Optional[Callable[[float], None]] = None
+            mask: Optional[Mask] = None,
+            progress_callback: Optional[Callable[[float], None]] = None,
+            cancel_token: Optional[CancellationToken] = None
     ) -> np.ndarray:
         if mode == 'mag_phase':
-            return self.mix_images_mag_phase(component1_sources, component2_sources, images, mask, progress_callback)
+            return self.mix_images_mag_phase(component1_sources, component2_sources, images, mask,
+                                             progress_callback, cancel_token)
         elif mode == 'real_imag':
-            return self.mix_images_real_imag(component1_sources, component2_sources, images, mask, progress_callback)
+            return self.mix_images_real_imag(component1_sources, component2_sources, images, mask,
+                                             progress_callback, cancel_token)
         else:
             raise ValueError(f"Unknown mode: {mode}")
 
+    def mix_batch(
+            self,
+            mode: Literal['mag_phase', 'real_imag'],
+            configurations: List[Tuple[Dict[int, float], Dict[int, float]]],
+            images: List[ImageModel],
+            mask: Optional[Mask] = None,
+            progress_callback: Optional[Callable[[float], None]] = None,
+            cancel_token: Optional[CancellationToken] = None
+    ) -> np.ndarray:
+        """
+        Mix many weight configurations of the same images in one call.
+
+        The component stacks are loaded once and each weight group is
+        contracted with its stack as a single (K, N) @ (N, H * W) product,
+        computing identical weight rows (e.g. the magnitude side of an
+        every-pairing sweep) once. In mag/phase mode cos/sin are likewise
+        taken once per distinct phase row, and the inverse FFT runs batched
+        over configurations. Real/imag mixing is linear, so with more
+        configurations than 2N it switches to the spatial bases: 2N inverse
+        FFTs, then every output is one row of a (K, 2N) @ (2N, H * W) product.
+
+        Configurations are processed in chunks of about _BATCH_CHUNK_BYTES.
+        Batch results bypass the stage cache.
+
+        Args:
+            mode: 'mag_phase' or 'real_imag'
+            configurations: (component1_sources, component2_sources) weight dicts per output
+            images: Images in mixing order
+            mask: Optional mask applied to every configuration
+            progress_callback: Called with the completed fraction after each chunk
+            cancel_token: Optional token checked between chunks and configurations
+
+        Returns:
+            Array of shape (K, H, W), one clipped image per configuration
+        """
+        if not images:
+            raise ValueError("No images provided")
+        if mode not in self.MODE_COMPONENTS:
+            raise ValueError(f"Unknown mode: {mode}")
+
+        shape = images[0].shape
+        fft_shape = images[0].get_fft_shape()
+        mask = self._usable_mask(mask, fft_shape)
+        total = len(configurations)
+        results = np.empty((total,) + tuple(shape), dtype=self._real_dtype)
+
+        if mode == 'real_imag' and total > 2 * len(images):
+            _, real_bases, imag_bases = self._get_spatial_bases(images, mask, fft_shape, shape, build=True,
+                                                                cancel_token=cancel_token)
+            bases = (real_bases.reshape(len(images), -1), imag_bases.reshape(len(images), -1))
+            weights = [np.array([self._weight_vector(configuration[group], len(images), self._real_dtype)
+                                 for configuration in configurations], dtype=self._real_dtype).reshape(-1, len(images))
+                       for group in (0, 1)]
+            flat = results.reshape(total, -1)
+            chunk = max(1, self._BATCH_CHUNK_BYTES // (2 * flat.shape[1] * flat.itemsize))
+            for start in range(0, total, chunk):
+                raise_if_cancelled(cancel_token)
+                stop = min(start + chunk, total)
+                np.dot(weights[0][start:stop], bases[0], out=flat[start:stop])
+                flat[start:stop] += weights[1][start:stop] @ bases[1]
+                np.clip(flat[start:stop], 0, 255, out=flat[start:stop])
+                if progress_callback: progress_callback(stop / total)
+            return results
+
+        half_mask = self._get_half_mask(mask) if mask is not None else None
+        support = self._mask_support(half_mask)
+        pruned = support is not None and self._pruned_terms(support, fft_shape) <= self._PRUNED_MAX_TERMS
+        combine = self._kernel.polar_to_complex if mode == 'mag_phase' else self._kernel.cartesian_to_complex
+
+        stacks = [self._component_stack.get(images, component_type)
+                  for component_type in self.MODE_COMPONENTS[mode]]
+        weights = [np.array([self._weight_vector(configuration[group], len(images), stacks[group].dtype)
+                             for configuration in configurations], dtype=stacks[group].dtype).reshape(-1, len(images))
+                   for group in (0, 1)]
+
+        half_shape = stacks[0].shape[1:]
+        # Two accumulators and a complex spectrum per configuration, plus the IFFT output
+        frame_bytes = np.dtype(self._real_dtype).itemsize * (4 * half_shape[0] * half_shape[1] + fft_shape[0] * fft_shape[1])
+        chunk = max(1, self._BATCH_CHUNK_BYTES // frame_bytes)
+
+        # Visit configurations grouped by their second weight group, so chunks
+        # see repeated rows (the phase side of a pairing sweep) together
+        order = np.lexsort(np.concatenate(weights, axis=1).T)
+
+        for start in range(0, total, chunk):
+            raise_if_cancelled(cancel_token)
+            stop = min(start + chunk, total)
+            positions = order[start:stop]
+            first, first_index = self._batch_accumulate(stacks[0], weights[0][positions])
+            second, second_index = self._batch_accumulate(stacks[1], weights[1][positions])
+
+            spectra = np.empty((stop - start,) + half_shape, dtype=self._complex_dtype)
+            if mode == 'mag_phase' and len(second) < stop - start:
+                # Phase rows are shared: exp(1j * phase) once per distinct row,
+                # masked magnitudes once per distinct row, one multiply per output
+                cosines, sines = np.cos(second), np.sin(second)
+                amplitudes = np.empty_like(first)
+                for index in range(len(first)):
+                    self._kernel.scale(first[index], amplitudes[index], half_mask, cancel_token)
+                for offset in range(stop - start):
+                    amplitude = amplitudes[first_index[offset]]
+                    np.multiply(amplitude, cosines[second_index[offset]], out=spectra[offset].real)
+                    np.multiply(amplitude, sines[second_index[offset]], out=spectra[offset].imag)
+            else:
+                for offset in range(stop - start):
+                    combine(first[first_index[offset]], second[second_index[offset]], spectra[offset], half_mask,
+                            cancel_token)
+
+            if pruned:
+                for offset, position in enumerate(positions):
+                    raise_if_cancelled(cancel_token)
+                    spatial = self._pruned_irfft2(spectra[offset], support, fft_shape, shape)
+                    np.clip(spatial, 0, 255, out=results[position])
+                    self._workspace.release(spatial)
+            else:
+                raise_if_cancelled(cancel_token)
+                spatial = self._fft_backend.irfft2(spectra, s=fft_shape)
+                for offset, position in enumerate(positions):
+                    np.clip(spatial[offset, :shape[0], :shape[1]], 0, 255, out=results[position])
+
+            if progress_callback: progress_callback(stop / total)
+
+        return results
+
+    def interpolate_frames(
+            self,
+            mode: Literal['mag_phase', 'real_imag'],
+            start_weights: Tuple[Dict[int, float], Dict[int, float]],
+            end_weights: Tuple[Dict[int, float], Dict[int, float]],
+            images: List[ImageModel],
+            frame_count: int,
+            start_mask: Optional[Mask] = None,
+            end_mask: Optional[Mask] = None
+    ) -> Iterator[np.ndarray]:
+        """
+        Stream the frames of a linear morph between two weight sets.
+
+        Frame i mixes with weights (1 - t) * start + t * end, t = i / (frame_count - 1),
+        and the mask crossfades the same way (pass the same mask twice to
+        keep it fixed; None means no mask). Accumulators are linear in the
+        weights, so both ends are accumulated once and each frame costs one
+        multiply-add per component instead of an N-image reduction. In
+        real/imag mode the whole reconstruction is a polynomial in t, so the
+        morph needs at most four inverse FFTs in total and each frame is a
+        few frame-sized multiply-adds.
+
+        Only O(1) frames are held at a time; every yielded frame is a new
+        array the caller may keep.
+
+        Args:
+            mode: 'mag_phase' or 'real_imag'
+            start_weights: (component1_sources, component2_sources) at t = 0
+            end_weights: (component1_sources, component2_sources) at t = 1
+            images: Images in mixing order
+            frame_count: Number of frames (both ends included)
+            start_mask: Mask at t = 0
+            end_mask: Mask at t = 1
+
+        Returns:
+            Iterator of clipped images of shape (H, W)
+        """
+        if not images:
+            raise ValueError("No images provided")
+        if mode not in self.MODE_COMPONENTS:
+            raise ValueError(f"Unknown mode: {mode}")
+        if frame_count < 1:
+            raise ValueError(f"frame_count must be positive, got {frame_count}")
+
+        shape = images[0].shape
+        fft_shape = images[0].get_fft_shape()
+        masks = [self._usable_mask(mask, fft_shape) for mask in (start_mask, end_mask)]
+        half_masks = [self._get_half_mask(mask) if mask is not None else None for mask in masks]
+        fixed_mask = self.get_mask_key(masks[0]) == self.get_mask_key(masks[1])
+
+        # Each component as start + t * (end - start)
+        ends = []
+        for group, component_type in enumerate(self.MODE_COMPONENTS[mode]):
+            _, start = self._accumulate(images, start_weights[group], component_type)
+            _, end = self._accumulate(images, end_weights[group], component_type)
+            ends.append((start, end - start))
+            self._workspace.release(end)
+
+        steps = np.linspace(0.0, 1.0, frame_count)
+        if mode == 'real_imag':
+            frames = self._interpolate_spatial(ends, half_masks, fixed_mask, steps, fft_shape, shape)
+        else:
+            frames = self._interpolate_polar(ends, half_masks, fixed_mask, steps, fft_shape, shape)
+        return self._release_after(frames, [start for start, _ in ends])
+
+    def _release_after(self, frames: Iterator[np.ndarray], buffers: List[np.ndarray]) -> Iterator[np.ndarray]:
+        """Yield the frames, then release the buffers (also when the caller stops early)."""
+        try:
+            yield from frames
+        finally:
+            for buffer in buffers:
+                self._workspace.release(buffer)
+
+    def _interpolate_polar(self, ends: List[Tuple[np.ndarray, np.ndarray]], half_masks: List[Optional[HalfMask]],
+                           fixed_mask: bool, steps: np.ndarray, fft_shape: Tuple[int, int],
+                           shape: Tuple[int, int]) -> Iterator[np.ndarray]:
+        """Mag/phase frames for interpolate_frames: polar pass and inverse FFT per frame."""
+        (magnitude_start, magnitude_delta), (phase_start, phase_delta) = ends
+        half_shape = magnitude_start.shape
+        magnitude = np.empty(half_shape, dtype=self._real_dtype)
+        phase = np.empty(half_shape, dtype=self._real_dtype)
+        spectrum = np.empty(half_shape, dtype=self._complex_dtype)
+
+        if fixed_mask:
+            half_mask = half_masks[0]
+            support = self._mask_support(half_mask)
+        else:
+            mask_start = self._dense_half_mask(half_masks[0], half_shape)
+            mask_delta = self._dense_half_mask(half_masks[1], half_shape) - mask_start
+            half_mask = np.empty(half_shape, dtype=self._real_dtype)
+            support = None
+
+        for step in steps:
+            np.multiply(magnitude_delta, step, out=magnitude)
+            magnitude += magnitude_start
+            np.multiply(phase_delta, step, out=phase)
+            phase += phase_start
+            if not fixed_mask:
+                np.multiply(mask_delta, step, out=half_mask)
+                half_mask += mask_start
+            self._kernel.polar_to_complex(magnitude, phase, spectrum, half_mask)
+            yield self._perform_ifft(spectrum, fft_shape, shape, support)
+
+    def _interpolate_spatial(self, ends: List[Tuple[np.ndarray, np.ndarray]], half_masks: List[Optional[HalfMask]],
+                             fixed_mask: bool, steps: np.ndarray, fft_shape: Tuple[int, int],
+                             shape: Tuple[int, int]) -> Iterator[np.ndarray]:
+        """
+        Real/imag frames for interpolate_frames, evaluated in the spatial domain.
+
+        With X(t) = X0 + t dX and M(t) = M0 + t dM the masked spectrum is
+        M0 X0 + t (M0 dX + dM X0) + t^2 dM dX, and the inverse FFT is linear,
+        so every frame is A + t B + t^2 C of three precomputed images.
+        """
+        (real_start, real_delta), (imag_start, imag_delta) = ends
+        half_shape = real_start.shape
+        spectrum = np.empty(half_shape, dtype=self._complex_dtype)
+
+        def spatial(real: np.ndarray, imag: np.ndarray, half_mask: Optional[HalfMask]) -> np.ndarray:
+            self._kernel.cartesian_to_complex(real, imag, spectrum, half_mask)
+            return self._fft_backend.irfft2(spectrum, s=fft_shape)[:shape[0], :shape[1]].astype(self._real_dtype)
+
+        constant = spatial(real_start, imag_start, half_masks[0])
+        linear = spatial(real_delta, imag_delta, half_masks[0])
+        quadratic = None
+        if not fixed_mask:
+            mask_start = self._dense_half_mask(half_masks[0], half_shape)
+            mask_delta = self._dense_half_mask(half_masks[1], half_shape) - mask_start
+            linear += spatial(real_start, imag_start, mask_delta)
+            quadratic = spatial(real_delta, imag_delta, mask_delta)
+
+        for step in steps:
+            frame = np.empty(tuple(shape), dtype=self._real_dtype)
+            # Horner: ((C t + B) t + A)
+            if quadratic is not None:
+                np.multiply(quadratic, step, out=frame)
+                frame += linear
+            else:
+                np.copyto(frame, linear)
+            frame *= step
+            frame += constant
+            yield np.clip(frame, 0, 255, out=frame)
+
+    def _dense_half_mask(self, half_mask: Optional[HalfMask], half_shape: Tuple[int, ...]) -> np.ndarray:
+        """Half spectrum mask as a dense array (all ones for no mask)."""
+        if half_mask is None:
+            return np.ones(half_shape, dtype=self._real_dtype)
+        if isinstance(half_mask, np.ndarray):
+            return half_mask.astype(self._real_dtype)
+        background, blocks = half_mask
+        dense = np.full(half_shape, background, dtype=self._real_dtype)
+        for rows, cols, value in blocks:
+            dense[rows, cols] = value
+        return dense
+
+    def _batch_accumulate(self, stack: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Contract each distinct row of a (K, N) weight matrix with an (N, ...) stack.
+
+        Returns:
+            Tuple of (accumulators of shape (U, ...), index of each row's accumulator)
+        """
+        unique, inverse = np.unique(weights, axis=0, return_inverse=True)
+        mixed = unique @ stack.reshape(len(stack), -1)
+        mixed = mixed.astype(self._real_dtype, copy=False).reshape((len(unique),) + stack.shape[1:])
+        return mixed, inverse.reshape(-1)
+
     # def create_region_mask(
     #         self,
     #         shape: tuple[int, int],
@@ -0,0 +1,193 @@
+"""ProcessMixer class for running mixes in worker processes on shared-memory spectra."""
+
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor, TimeoutError
+from typing import Any, Callable, Dict, List, Optional
+import numpy as np
+from models.fft_backend import FFTBackend
+from models.image_model import PRECISION_DTYPES
+from .cancellation import CancellationToken, JobCancelledError
+from .component_stack import ComponentStack
+from .mixer_engine import MixerEngine
+from .reconstruction_kernel import ReconstructionKernel
+from .shared_arrays import SharedArrayRef, SharedArrayStore, attach, retain_attached
+
+
+class ProcessMixer:
+    """
+    Runs MixerEngine jobs in a pool of worker processes.
+
+    numpy releases the GIL inside its loops, but the Python glue of a mix
+    still contends with the Dash/Flask threads that build figures. Here the
+    mix itself runs in another process: each component stack of the
+    session's images is written once into a shared memory block (keyed by
+    the image versions, like ComponentStack), the job sends only block names,
+    weights and the half mask, and the worker writes the clipped image into
+    a pooled shared output block that this process copies out. Workers keep
+    a single-threaded MixerEngine each (one process per core instead of
+    threads per mix), so their accumulators still take delta updates.
+    Memory: each published component is a second copy next to the image's
+    own (the parent's ComponentStack is not built in this mode), where the
+    thread mode holds it once.
+
+    Cancellation works until the job reaches a worker; after that the
+    caller gets JobCancelledError right away while the worker finishes and
+    its output is discarded. Batch inputs ('configurations') run in the
+    calling thread on the parent engine.
+    """
+
+    # Seconds between cancellation checks while waiting for a worker
+    _POLL_INTERVAL = 0.05
+
+    def __init__(self, engine: MixerEngine, workers: Optional[int] = None):
+        """
+        Initialize ProcessMixer. Worker processes start on the first job.
+
+        Args:
+            engine: Parent engine (precision, half masks, batch fallback)
+            workers: Worker processes. None uses every CPU core.
+        """
+        self._engine = engine
+        self._workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._store = SharedArrayStore()
+        # Unlink the shared blocks when this mixer is collected or the process exits
+        self._finalizer = weakref.finalize(self, self._store.close)
+
+    def run_async_task(self, inputs: Dict[str, Any],
+                       progress_callback: Optional[Callable[[float], None]] = None,
+                       cancel_token: Optional[CancellationToken] = None) -> np.ndarray:
+        """
+        Same contract as MixerEngine.run_async_task, computed in a worker process.
+        """
+        if 'configurations' in inputs:
+            return self._engine.run_async_task(inputs, progress_callback, cancel_token)
+
+        mode = inputs.get('mode', 'mag_phase')
+        images = inputs.get('images', [])
+        if not images:
+            raise ValueError("No images provided")
+        if mode not in MixerEngine.MODE_COMPONENTS:
+            raise ValueError(f"Unknown mode: {mode}")
+
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        if progress_callback: progress_callback(0.1)
+
+        shape = images[0].shape
+        fft_shape = images[0].get_fft_shape()
+        precision = self._engine.get_precision()
+        half_mask = self._engine.get_half_mask(inputs.get('mask'), fft_shape)
+
+        leases: List[SharedArrayRef] = []
+        stacks = [self._publish_stack(images, component_type)
+                  for component_type in MixerEngine.MODE_COMPONENTS[mode]]
+        leases.extend(stacks)
+        if isinstance(half_mask, np.ndarray):
+            mask_ref = self._store.publish(('half_mask', MixerEngine.get_mask_key(inputs.get('mask')),
+                                            half_mask.dtype.str),
+                                           half_mask.shape, half_mask.dtype,
+                                           lambda view: np.copyto(view, half_mask))
+            leases.append(mask_ref)
+            half_mask = mask_ref
+        output = self._store.borrow_output(shape, PRECISION_DTYPES[precision][0])
+
+        weights = [self._weight_vector(inputs.get(name, {}), len(images)) for name in ('weights1', 'weights2')]
+        task = {'mode': mode, 'precision': precision, 'weights': weights, 'stacks': stacks,
+                'fft_shape': tuple(fft_shape), 'shape': tuple(shape), 'half_mask': half_mask, 'output': output,
+                'live_blocks': self._store.get_names()}
+
+        def release(_future=None) -> None:
+            for ref in leases:
+                self._store.release(ref)
+            self._store.return_output(output)
+
+        if progress_callback: progress_callback(0.3)
+        future = self._get_executor().submit(_mix_in_worker, task)
+        while True:
+            try:
+                future.result(timeout=self._POLL_INTERVAL)
+                break
+            except TimeoutError:
+                if cancel_token is not None and cancel_token.is_cancelled():
+                    future.cancel()
+                    # The blocks go back only once the worker is done with them
+                    future.add_done_callback(release)
+                    raise JobCancelledError("Job was cancelled")
+            except BaseException:
+                release()
+                raise
+
+        if progress_callback: progress_callback(0.95)
+        view = self._store.view_output(output)
+        result = view.copy()
+        del view
+        release()
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes and unlink every shared block."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        self._finalizer()
+
+    def _publish_stack(self, images: List, component_type: str) -> SharedArrayRef:
+        """Write a component stack into shared memory once per image set and lease it."""
+        layers = [image.get_half_data(component_type) if image is not None else None for image in images]
+        reference = next(layer for layer in layers if layer is not None)
+
+        def fill(stack: np.ndarray) -> None:
+            for index, layer in enumerate(layers):
+                if layer is None:
+                    stack[index] = 0
+                else:
+                    stack[index] = layer
+
+        key = ('stack', component_type, ComponentStack.get_key(images))
+        return self._store.publish(key, (len(layers),) + reference.shape, reference.dtype, fill)
+
+    @staticmethod
+    def _weight_vector(sources: Dict[int, float], count: int) -> np.ndarray:
+        """Dense float64 weight vector (the worker casts it to the stack dtype)."""
+        weights = np.zeros(count)
+        for idx, weight in sources.items():
+            if 0 <= idx < count:
+                weights[idx] = weight
+        return weights
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Start the worker processes on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                # spawn: forking a process that runs Flask and pool threads is unsafe
+                self._executor = ProcessPoolExecutor(max_workers=self._workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+            return self._executor
+
+
+# One single-threaded engine per precision in each worker process
+_worker_engines: Dict[str, MixerEngine] = {}
+
+
+def _mix_in_worker(task: Dict[str, Any]) -> None:
+    """Worker process body: mix the mapped stacks into the shared output block."""
+    engine = _worker_engines.get(task['precision'])
+    if engine is None:
+        engine = MixerEngine(task['precision'], fft_backend=FFTBackend(workers=1),
+                             kernel=ReconstructionKernel(workers=1))
+        _worker_engines[task['precision']] = engine
+
+    # Let go of blocks the parent has unlinked since the last job
+    retain_attached(task['live_blocks'])
+    stacks = tuple(attach(ref) for ref in task['stacks'])
+    half_mask = task['half_mask']
+    if isinstance(half_mask, SharedArrayRef):
+        half_mask = attach(half_mask)
+
+    engine.mix_stacks(task['mode'], task['weights'], stacks, tuple(ref.name for ref in task['stacks']),
+                      task['fft_shape'], task['shape'], half_mask, out=attach(task['output'], writeable=True))
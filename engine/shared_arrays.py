@@ -0,0 +1,244 @@
+"""SharedArrayStore class for publishing arrays to worker processes through shared memory."""
+
+import threading
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, List, NamedTuple, Tuple
+import numpy as np
+
+
+class SharedArrayRef(NamedTuple):
+    """Picklable handle of an array in a shared memory block."""
+    name: str
+    shape: Tuple[int, ...]
+    dtype: str
+
+
+class SharedArrayStore:
+    """
+    Owner side of the shared memory blocks used by ProcessMixer.
+
+    publish() creates a block for a key once and fills it in place (a
+    session's component stacks are written straight into shared memory, not
+    built and then copied); jobs pass the small SharedArrayRef to workers,
+    which map the block with the module-level attach(). Each use of a
+    published array holds a lease, and blocks pushed out of the LRU are
+    unlinked only once their last lease is returned, so a queued job never
+    finds its input gone.
+
+    Output blocks are kept on a separate free list per (shape, dtype) and
+    handed out with borrow_output() / return_output().
+
+    A worker's mapping keeps an unlinked block's memory alive, so jobs also
+    carry get_names() and workers drop the mappings of every other block
+    (see retain_attached()).
+    """
+
+    def __init__(self, capacity: int = 8, max_outputs_per_key: int = 4):
+        """
+        Initialize SharedArrayStore.
+
+        Args:
+            capacity: Published arrays kept after their last lease is returned
+            max_outputs_per_key: Idle output blocks kept per (shape, dtype)
+        """
+        self._capacity = capacity
+        self._max_outputs_per_key = max_outputs_per_key
+        self._published: "OrderedDict[Hashable, Tuple[shared_memory.SharedMemory, SharedArrayRef]]" = OrderedDict()
+        self._leases: Dict[str, int] = {}
+        self._retired: Dict[str, shared_memory.SharedMemory] = {}
+        self._outputs: Dict[str, shared_memory.SharedMemory] = {}
+        self._free_outputs: Dict[Tuple[Tuple[int, ...], str], List[str]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, key: Hashable, shape: Tuple[int, ...], dtype: np.dtype,
+                fill: Callable[[np.ndarray], None]) -> SharedArrayRef:
+        """
+        Get the shared array for a key, creating and filling it on first use, and take a lease on it.
+
+        Args:
+            key: Identity of the array's contents
+            shape: Array shape
+            dtype: Array dtype
+            fill: Writes the contents into the new array (called once, with the lock held)
+
+        Returns:
+            Handle to pass to workers; give it back with release()
+        """
+        with self._lock:
+            entry = self._published.get(key)
+            if entry is None:
+                dtype = np.dtype(dtype)
+                block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+                ref = SharedArrayRef(block.name, tuple(int(n) for n in shape), dtype.str)
+                fill(np.ndarray(ref.shape, dtype=dtype, buffer=block.buf))
+                entry = (block, ref)
+                self._published[key] = entry
+                self._evict()
+            self._published.move_to_end(key)
+            ref = entry[1]
+            self._leases[ref.name] = self._leases.get(ref.name, 0) + 1
+            return ref
+
+    def release(self, ref: SharedArrayRef) -> None:
+        """
+        Return a lease taken by publish().
+
+        Args:
+            ref: Handle returned by publish()
+        """
+        with self._lock:
+            self._leases[ref.name] -= 1
+            if self._leases[ref.name] == 0:
+                del self._leases[ref.name]
+                block = self._retired.pop(ref.name, None)
+                if block is not None:
+                    self._unlink(block)
+
+    def borrow_output(self, shape: Tuple[int, ...], dtype: np.dtype) -> SharedArrayRef:
+        """
+        Take an output block, creating one if none is idle.
+
+        Args:
+            shape: Output shape
+            dtype: Output dtype
+
+        Returns:
+            Handle of a block with undefined contents; give it back with return_output()
+        """
+        dtype = np.dtype(dtype)
+        key = (tuple(int(n) for n in shape), dtype.str)
+        with self._lock:
+            free = self._free_outputs.get(key)
+            if free:
+                return SharedArrayRef(free.pop(), key[0], key[1])
+            block = shared_memory.SharedMemory(create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize))
+            self._outputs[block.name] = block
+            return SharedArrayRef(block.name, key[0], key[1])
+
+    def view_output(self, ref: SharedArrayRef) -> np.ndarray:
+        """
+        Map an output block in this process.
+
+        The view must be dropped before the block is returned.
+
+        Args:
+            ref: Handle returned by borrow_output()
+
+        Returns:
+            Array backed by the block
+        """
+        return np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=self._outputs[ref.name].buf)
+
+    def return_output(self, ref: SharedArrayRef) -> None:
+        """
+        Put an output block back on the free list (or free it if the list is full).
+
+        Args:
+            ref: Handle returned by borrow_output()
+        """
+        with self._lock:
+            free = self._free_outputs.setdefault((ref.shape, ref.dtype), [])
+            if len(free) < self._max_outputs_per_key:
+                free.append(ref.name)
+                return
+            block = self._outputs.pop(ref.name)
+        self._unlink(block)
+
+    def get_names(self) -> FrozenSet[str]:
+        """
+        Get the names of the blocks not yet unlinked.
+
+        Returns:
+            Names of the published, retired and output blocks
+        """
+        with self._lock:
+            return frozenset(ref.name for _, ref in self._published.values()) | \
+                frozenset(self._retired) | frozenset(self._outputs)
+
+    def close(self) -> None:
+        """Unlink every block. Handles given out before become invalid."""
+        with self._lock:
+            blocks = [block for block, _ in self._published.values()] + list(self._retired.values())
+            blocks += list(self._outputs.values())
+            self._published.clear()
+            self._retired.clear()
+            self._outputs.clear()
+            self._free_outputs.clear()
+            self._leases.clear()
+        for block in blocks:
+            self._unlink(block)
+
+    def _evict(self) -> None:
+        """Drop the least recently used arrays beyond capacity (lock held)."""
+        while len(self._published) > self._capacity:
+            _, (block, ref) = self._published.popitem(last=False)
+            if self._leases.get(ref.name, 0) > 0:
+                self._retired[ref.name] = block
+            else:
+                self._leases.pop(ref.name, None)
+                self._unlink(block)
+
+    @staticmethod
+    def _unlink(block: shared_memory.SharedMemory) -> None:
+        """Remove a block's name and unmap it here (processes that mapped it keep their mapping)."""
+        try:
+            block.unlink()
+        except FileNotFoundError:
+            pass
+        try:
+            block.close()
+        except BufferError:
+            # A view still exists; the mapping goes away with it
+            pass
+
+
+# Blocks mapped by this (worker) process
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+
+
+def attach(ref: SharedArrayRef, writeable: bool = False) -> np.ndarray:
+    """
+    Map a shared array in a worker process.
+
+    Mappings are cached per process, so a session's stacks are mapped once
+    per worker, not once per job, until retain_attached() drops them.
+
+    Args:
+        ref: Handle from SharedArrayStore.publish() or borrow_output()
+        writeable: Return a writable view (for output blocks)
+
+    Returns:
+        Array backed by the shared block
+    """
+    entry = _attached.get(ref.name)
+    if entry is None:
+        block = shared_memory.SharedMemory(name=ref.name)
+        entry = (block, np.ndarray(ref.shape, dtype=np.dtype(ref.dtype), buffer=block.buf))
+        _attached[ref.name] = entry
+
+    view = entry[1].view()
+    view.flags.writeable = writeable
+    return view
+
+
+def retain_attached(names: Iterable[str]) -> None:
+    """
+    Unmap the blocks of this (worker) process that are not in names.
+
+    The owner unlinks blocks it evicts, but their memory stays allocated
+    while any process still maps them, so workers call this with the
+    owner's SharedArrayStore.get_names() before each job.
+
+    Args:
+        names: Names of the blocks to keep mapped
+    """
+    names = set(names)
+    for name in [name for name in _attached if name not in names]:
+        block, array = _attached.pop(name)
+        del array
+        try:
+            block.close()
+        except BufferError:
+            # A view still exists; the mapping goes away with it
+            pass
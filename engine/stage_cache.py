@@ -0,0 +1,112 @@
+"""StageCache class for memoizing the intermediate stages of a mix."""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+
+class StageCache:
+    """
+    Memoizes each stage of the mixing pipeline under a key built from its inputs.
+
+    Each stage's key is derived from the keys of its inputs (image versions,
+    the weights of its group, mask identity). MixerEngine caches:
+
+    - 'magnitude' / 'phase' / 'real' / 'imag': the weighted sum of one
+      component over the images. Changing only the phase weights reuses the
+      magnitude sum, and toggling the ROI reuses both sums, since the mask is
+      applied later.
+    - 'half_mask': a mask converted to the half spectrum layout, reused
+      while the mask is unchanged.
+    - 'ifft': the clipped image for a pair of sums, mask and shape. The mask
+      is folded into the polar-to-complex (or real/imag combine) pass that
+      builds the spectrum, and that spectrum is not cached: it is rebuilt
+      only on an 'ifft' miss. A hit returns a repeated mix without any work.
+    - 'spatial': the real/imag image summed from cached spatial bases, per
+      weight pair.
+
+    Every stage keeps its few most recent outputs; values must be treated as
+    read-only by callers.
+    """
+
+    def __init__(self, entries_per_stage: int = 2, retain: Optional[Callable[[Any], None]] = None,
+                 release: Optional[Callable[[Any], None]] = None):
+        """
+        Initialize StageCache.
+
+        Args:
+            entries_per_stage: Outputs remembered per stage (older ones are evicted)
+            retain: Called (with the lock held) with each output the cache stores and
+                    each output it returns on a hit, e.g. WorkspacePool.retain, so the
+                    cache and every caller own the output
+            release: Called with each evicted or cleared output (the cache's own reference)
+        """
+        self._entries_per_stage = entries_per_stage
+        self._retain = retain
+        self._release = release
+        self._stages: Dict[str, "OrderedDict[Hashable, Any]"] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, stage: str, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Return the cached output of a stage, computing and storing it on a miss.
+
+        Args:
+            stage: Stage name
+            key: Identity of the stage's inputs
+            compute: Produces the stage output on a miss (called without the lock held)
+
+        Returns:
+            Stage output (owned by the caller when a retain hook is set)
+        """
+        with self._lock:
+            entries = self._stages.setdefault(stage, OrderedDict())
+            stats = self._stats.setdefault(stage, {'hits': 0, 'misses': 0})
+            if key in entries:
+                entries.move_to_end(key)
+                stats['hits'] += 1
+                value = entries[key]
+                if self._retain is not None:
+                    self._retain(value)
+                return value
+            stats['misses'] += 1
+
+        value = compute()
+
+        evicted = []
+        with self._lock:
+            # Another thread may have stored the same key (or cleared the cache) meanwhile
+            entries = self._stages.setdefault(stage, OrderedDict())
+            if key not in entries:
+                entries[key] = value
+                if self._retain is not None:
+                    self._retain(value)
+            entries.move_to_end(key)
+            while len(entries) > self._entries_per_stage:
+                evicted.append(entries.popitem(last=False)[1])
+        self._release_all(evicted)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached output (statistics are kept)."""
+        with self._lock:
+            evicted = [value for entries in self._stages.values() for value in entries.values()]
+            self._stages.clear()
+        self._release_all(evicted)
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get hit/miss counts per stage.
+
+        Returns:
+            Dictionary of stage name -> {'hits': int, 'misses': int}
+        """
+        with self._lock:
+            return {stage: dict(stats) for stage, stats in self._stats.items()}
+
+    def _release_all(self, values: List[Any]) -> None:
+        """Hand the cache's references to dropped outputs to the release hook."""
+        if self._release is not None:
+            for value in values:
+                self._release(value)
@@ -0,0 +1,209 @@
+"""WorkerPool class for running mixing jobs on long-lived threads with a bounded queue."""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional
+
+
+class WorkerPoolFullError(RuntimeError):
+    """Raised by WorkerPool.submit when the queue is at capacity."""
+
+
+class WorkItem:
+    """A task waiting in (or taken from) a WorkerPool queue, runnable from ready_at on."""
+
+    def __init__(self, task: Callable[[], None], ready_at: float):
+        self.task = task
+        self.ready_at = ready_at
+
+
+class WorkerPool:
+    """
+    Fixed set of worker threads fed from a bounded FIFO queue.
+
+    The threads start with the pool and live until shutdown(), so the
+    thread count stays the same however many sessions submit work. When
+    max_queue tasks are already waiting, submit() raises
+    WorkerPoolFullError instead of letting the backlog (and the latency
+    of everything behind it) grow without bound; the caller decides
+    whether to reject the work or hold it and retry when on_slot_free is
+    called.
+
+    A task may be queued with a ready time in the future (how
+    AsyncJobManager debounces submissions): workers take the oldest task
+    that is ready and sleep until the next one becomes ready, so delayed
+    tasks need no timer threads of their own.
+
+    Queue wait and run times of the most recent tasks are kept for
+    saturation metrics (see get_stats).
+    """
+
+    # Recent tasks kept for the wait/run time statistics
+    _TIMING_SAMPLES = 256
+
+    def __init__(self, workers: int = 2, max_queue: int = 8,
+                 on_slot_free: Optional[Callable[[], None]] = None, name: str = 'worker'):
+        """
+        Initialize WorkerPool and start its threads.
+
+        Args:
+            workers: Number of worker threads
+            max_queue: Tasks that may wait for a worker; submit() fails beyond this
+            on_slot_free: Called (without locks held) whenever a task finishes or a
+                          queued task is cancelled, i.e. when submit() may succeed again
+            name: Thread name prefix
+        """
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if max_queue < 0:
+            raise ValueError(f"max_queue must not be negative, got {max_queue}")
+        self._max_queue = max_queue
+        self._on_slot_free = on_slot_free
+        self._queue: Deque[WorkItem] = deque()
+        self._condition = threading.Condition()
+        self._busy = 0
+        self._closed = False
+        self._counts = {'submitted': 0, 'rejected': 0, 'cancelled': 0, 'completed': 0, 'failed': 0}
+        self._wait_times: Deque[float] = deque(maxlen=self._TIMING_SAMPLES)
+        self._run_times: Deque[float] = deque(maxlen=self._TIMING_SAMPLES)
+
+        self._threads: List[threading.Thread] = []
+        for index in range(workers):
+            thread = threading.Thread(target=self._work, name=f'{name}-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, task: Callable[[], None], ready_at: Optional[float] = None) -> WorkItem:
+        """
+        Queue a task.
+
+        Args:
+            task: Callable run on a worker thread; exceptions are printed and swallowed
+            ready_at: time.monotonic() from which the task may run and counts as waiting
+                      (defaults to now; a later time delays it, an earlier time
+                      accounts for work that was held back)
+
+        Returns:
+            WorkItem handle for cancel()
+
+        Raises:
+            WorkerPoolFullError: If max_queue tasks are already waiting
+        """
+        item = WorkItem(task, time.monotonic() if ready_at is None else ready_at)
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("WorkerPool is shut down")
+            # Idle workers take tasks at once, so they count as free queue slots
+            if len(self._queue) >= self._max_queue + (len(self._threads) - self._busy):
+                self._counts['rejected'] += 1
+                raise WorkerPoolFullError(f"{len(self._queue)} tasks already queued")
+            self._queue.append(item)
+            self._counts['submitted'] += 1
+            self._condition.notify()
+        return item
+
+    def cancel(self, item: WorkItem) -> bool:
+        """
+        Remove a task that has not started yet.
+
+        Args:
+            item: Handle returned by submit()
+
+        Returns:
+            True if the task was still queued (it will never run)
+        """
+        with self._condition:
+            try:
+                self._queue.remove(item)
+            except ValueError:
+                return False
+            self._counts['cancelled'] += 1
+        if self._on_slot_free is not None:
+            self._on_slot_free()
+        return True
+
+    def get_queue_depth(self) -> int:
+        """Get the number of tasks waiting for a worker."""
+        with self._condition:
+            return len(self._queue)
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Get saturation metrics.
+
+        Returns:
+            Dictionary with workers, busy, queue_depth, max_queue, the submitted/
+            rejected/cancelled/completed/failed counts, and mean / 95th percentile /
+            max of the queue wait and run times in seconds over recent tasks
+        """
+        with self._condition:
+            stats: Dict[str, float] = {
+                'workers': len(self._threads),
+                'busy': self._busy,
+                'queue_depth': len(self._queue),
+                'max_queue': self._max_queue
+            }
+            stats.update(self._counts)
+            timings = {'wait_time': list(self._wait_times), 'run_time': list(self._run_times)}
+
+        for name, samples in timings.items():
+            samples.sort()
+            stats[f'{name}_mean'] = sum(samples) / len(samples) if samples else 0.0
+            stats[f'{name}_p95'] = samples[int(0.95 * (len(samples) - 1))] if samples else 0.0
+            stats[f'{name}_max'] = samples[-1] if samples else 0.0
+        return stats
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers after the tasks already queued.
+
+        Args:
+            wait: Block until every worker has exited
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self) -> None:
+        """Worker thread body: take tasks in FIFO order until shutdown."""
+        while True:
+            with self._condition:
+                item = self._take_ready()
+                if item is None:
+                    return
+                self._busy += 1
+                started = time.monotonic()
+                self._wait_times.append(started - item.ready_at)
+
+            failed = False
+            try:
+                item.task()
+            except Exception as e:
+                print(f"Worker Error: {e}")
+                failed = True
+
+            with self._condition:
+                self._busy -= 1
+                self._run_times.append(time.monotonic() - started)
+                self._counts['failed' if failed else 'completed'] += 1
+
+            if self._on_slot_free is not None:
+                self._on_slot_free()
+
+    def _take_ready(self) -> Optional[WorkItem]:
+        """Wait for the oldest ready task and remove it from the queue; None after shutdown (condition held)."""
+        while True:
+            now = time.monotonic()
+            for item in self._queue:
+                if item.ready_at <= now:
+                    self._queue.remove(item)
+                    return item
+            if self._closed and not self._queue:
+                return None
+            # Sleep until the earliest delayed task is due (or a submit/shutdown wakes us)
+            timeout = min(item.ready_at for item in self._queue) - now if self._queue else None
+            self._condition.wait(timeout)
@@ -0,0 +1,142 @@
+"""WorkspacePool class for reusing frame-sized buffers across mixes."""
+
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+import numpy as np
+
+PoolKey = Tuple[Tuple[int, ...], str]
+
+
+class WorkspacePool:
+    """
+    Free lists of preallocated arrays keyed by (shape, dtype).
+
+    MixerEngine takes its accumulators, spectra, outputs and scratch buffers
+    from the pool and fills them with out= / in-place ufuncs. Once a session
+    has run a few mixes at a given size, a new mix reuses those buffers
+    instead of asking the allocator for fresh frame-sized blocks, which keeps
+    RSS flat under concurrent jobs.
+
+    Ownership is explicit and counted here, not inferred from interpreter
+    reference counts: acquire() hands out a buffer with one owner, retain()
+    adds an owner (a cache entry, a second job reading it) and release()
+    drops one. A buffer goes back on its free list only when its last owner
+    releases it; one whose owner never does (e.g. a result kept by the UI)
+    is simply left to the garbage collector. retain() and release() ignore
+    arrays the pool did not hand out.
+    """
+
+    def __init__(self, max_buffers_per_key: int = 4):
+        """
+        Initialize WorkspacePool.
+
+        Args:
+            max_buffers_per_key: Idle buffers kept per (shape, dtype); extra ones are freed
+        """
+        self._max_buffers_per_key = max_buffers_per_key
+        self._free: Dict[PoolKey, List[np.ndarray]] = {}
+        # id() of each buffer handed out -> number of owners
+        self._owners: Dict[int, int] = {}
+        # Reentrant: a buffer dropped while the lock is held runs _forget()
+        self._lock = threading.RLock()
+        self._allocations = 0
+        self._reuses = 0
+
+    def acquire(self, shape: Tuple[int, ...], dtype: np.dtype) -> np.ndarray:
+        """
+        Take a writable buffer from the pool, allocating one if none is idle.
+
+        Args:
+            shape: Buffer shape
+            dtype: Buffer dtype
+
+        Returns:
+            C-contiguous array with undefined contents, owned once by the caller
+        """
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                self._reuses += 1
+                array = free.pop()
+                self._owners[id(array)] = 1
+                return array
+            self._allocations += 1
+        array = np.empty(shape, dtype=dtype)
+        # Stop tracking the buffer if its owners drop it without releasing it
+        weakref.finalize(array, self._forget, id(array))
+        with self._lock:
+            self._owners[id(array)] = 1
+        return array
+
+    def retain(self, array: np.ndarray) -> None:
+        """
+        Add an owner to a buffer handed out by acquire().
+
+        Args:
+            array: Buffer to keep; other arrays are ignored
+        """
+        with self._lock:
+            if id(array) in self._owners:
+                self._owners[id(array)] += 1
+
+    def release(self, array: np.ndarray) -> None:
+        """
+        Drop an owner of a buffer; the last release returns it to the pool.
+
+        The caller must not use the array afterwards.
+
+        Args:
+            array: Buffer from acquire(); other arrays are ignored
+        """
+        with self._lock:
+            owners = self._owners.get(id(array))
+            if owners is None:
+                return
+            if owners > 1:
+                self._owners[id(array)] = owners - 1
+                return
+            del self._owners[id(array)]
+            array.flags.writeable = True
+            free = self._free.setdefault((array.shape, array.dtype.str), [])
+            if len(free) < self._max_buffers_per_key:
+                free.append(array)
+
+    @contextmanager
+    def borrow(self, shape: Tuple[int, ...], dtype: np.dtype) -> Iterator[np.ndarray]:
+        """Lend a scratch buffer for the duration of the with-block."""
+        array = self.acquire(shape, dtype)
+        try:
+            yield array
+        finally:
+            self.release(array)
+
+    def clear(self) -> None:
+        """Free every idle buffer (statistics are kept)."""
+        with self._lock:
+            self._free.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dictionary with idle buffers, idle bytes, buffers in use (handed
+            out and not released yet), allocations and reuses
+        """
+        with self._lock:
+            idle = [array for free in self._free.values() for array in free]
+            return {
+                'idle_buffers': len(idle),
+                'idle_bytes': sum(array.nbytes for array in idle),
+                'in_use': len(self._owners),
+                'allocations': self._allocations,
+                'reuses': self._reuses
+            }
+
+    def _forget(self, array_id: int) -> None:
+        """Drop the owner count of a buffer that was garbage collected while handed out."""
+        with self._lock:
+            self._owners.pop(array_id, None)
@@ -2,6 +2,10 @@
 
 from .image_model import ImageModel
 from .global_session_state import GlobalSessionState
+from .fft_backend import FFTBackend, get_default_backend
+from .shape_cache import ShapeCache
+from .rw_lock import ReadWriteLock
 
-__all__ = ['ImageModel', 'GlobalSessionState']
+__all__ = ['ImageModel', 'GlobalSessionState', 'FFTBackend', 'get_default_backend', 'ShapeCache',
+           'ReadWriteLock']
 
@@ -0,0 +1,197 @@
+"""FFTBackend class for dispatching 2D real FFTs to the fastest available library."""
+
+import os
+import threading
+import numpy as np
+from typing import Optional, Tuple
+
+try:
+    import scipy.fft as _scipy_fft
+except ImportError:  # scipy is optional; numpy.fft is always available
+    _scipy_fft = None
+
+
+class FFTBackend:
+    """
+    Runs the forward and inverse real 2D FFTs used by ImageModel and MixerEngine.
+
+    Uses scipy.fft when it is installed, which spreads each transform over
+    `workers` threads, and falls back to single-threaded numpy.fft otherwise.
+    Both are pocketfft underneath and keep an internal plan cache keyed by
+    length, so repeated shapes reuse their twiddle factors; routing every
+    transform through one backend keeps the calls identical (same axes, dtype
+    and shape) so those cached plans are actually hit.
+    """
+
+    def __init__(self, workers: Optional[int] = None, use_scipy: bool = True):
+        """
+        Initialize FFTBackend.
+
+        Args:
+            workers: Number of threads per transform. None uses every CPU core.
+            use_scipy: Use scipy.fft when available. If False, always use numpy.fft.
+        """
+        self._use_scipy = use_scipy and _scipy_fft is not None
+        self.set_workers(workers)
+
+    def set_workers(self, workers: Optional[int]) -> None:
+        """
+        Set the number of threads each transform may use.
+
+        Args:
+            workers: Positive thread count, or None for every CPU core
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError(f"workers must be positive, got {workers}")
+        self._workers = int(workers)
+
+    def get_workers(self) -> int:
+        """
+        Get the number of threads each transform may use.
+
+        Returns:
+            Thread count (always 1 for the numpy fallback)
+        """
+        return self._workers if self._use_scipy else 1
+
+    def get_name(self) -> str:
+        """
+        Get the name of the library doing the transforms.
+
+        Returns:
+            'scipy' or 'numpy'
+        """
+        return 'scipy' if self._use_scipy else 'numpy'
+
+    @staticmethod
+    def is_fast_len(n: int) -> bool:
+        """
+        Check whether a transform length is 5-smooth (only factors 2, 3 and 5).
+
+        pocketfft is several times faster on these lengths than on lengths with
+        large prime factors.
+
+        Args:
+            n: Transform length
+
+        Returns:
+            True if n is 5-smooth
+        """
+        if n < 1:
+            return False
+        for factor in (2, 3, 5):
+            while n % factor == 0:
+                n //= factor
+        return n == 1
+
+    @classmethod
+    def next_fast_len(cls, n: int) -> int:
+        """
+        Smallest 5-smooth length >= n (pad target).
+
+        Args:
+            n: Minimum transform length
+
+        Returns:
+            Fast transform length
+        """
+        while not cls.is_fast_len(n):
+            n += 1
+        return n
+
+    @classmethod
+    def prev_fast_len(cls, n: int) -> int:
+        """
+        Largest 5-smooth length <= n (crop target).
+
+        Args:
+            n: Maximum transform length
+
+        Returns:
+            Fast transform length
+        """
+        while n > 1 and not cls.is_fast_len(n):
+            n -= 1
+        return max(n, 1)
+
+    def rfft2(self, data: np.ndarray, s: Optional[Tuple[int, int]] = None) -> np.ndarray:
+        """
+        Forward real 2D FFT (unshifted, half spectrum of shape (H, W // 2 + 1)).
+
+        Args:
+            data: Real input array
+            s: Optional transform shape (zero-pads or crops the input)
+
+        Returns:
+            Complex half spectrum
+        """
+        if self._use_scipy:
+            return _scipy_fft.rfft2(data, s=s, workers=self._workers)
+        return np.fft.rfft2(data, s=s)
+
+    def irfft2(self, half_ft: np.ndarray, s: Tuple[int, int]) -> np.ndarray:
+        """
+        Inverse real 2D FFT of a half spectrum (over the last two axes).
+
+        Args:
+            half_ft: Complex half spectrum of shape (..., H, W // 2 + 1); leading axes are batched
+            s: Output shape (H, W); needed because W // 2 + 1 is ambiguous
+
+        Returns:
+            Real output array of shape (..., H, W)
+        """
+        if self._use_scipy:
+            return _scipy_fft.irfft2(half_ft, s=s, workers=self._workers)
+        return np.fft.irfft2(half_ft, s=s)
+
+    def ifft(self, data: np.ndarray, n: int, axis: int) -> np.ndarray:
+        """
+        Inverse complex 1D FFT along one axis (the first pass of irfft2).
+
+        Args:
+            data: Complex input array
+            n: Transform length
+            axis: Axis to transform
+
+        Returns:
+            Complex output array
+        """
+        if self._use_scipy:
+            return _scipy_fft.ifft(data, n=n, axis=axis, workers=self._workers)
+        return np.fft.ifft(data, n=n, axis=axis)
+
+    def irfft(self, half_ft: np.ndarray, n: int, axis: int) -> np.ndarray:
+        """
+        Inverse real 1D FFT of a half spectrum along one axis (the last pass of irfft2).
+
+        Args:
+            half_ft: Complex half spectrum with n // 2 + 1 entries along axis
+            n: Output length along axis
+            axis: Axis to transform
+
+        Returns:
+            Real output array
+        """
+        if self._use_scipy:
+            return _scipy_fft.irfft(half_ft, n=n, axis=axis, workers=self._workers)
+        return np.fft.irfft(half_ft, n=n, axis=axis)
+
+
+_default_backend: Optional[FFTBackend] = None
+_default_backend_lock = threading.Lock()
+
+
+def get_default_backend() -> FFTBackend:
+    """
+    Get the process-wide FFTBackend shared by ImageModel and MixerEngine.
+
+    Returns:
+        The shared FFTBackend instance (created on first use)
+    """
+    global _default_backend
+    with _default_backend_lock:
+        if _default_backend is None:
+            _default_backend = FFTBackend()
+        return _default_backend
@@ -1,7 +1,7 @@
 """GlobalSessionState class for managing session-wide image data."""
 
 from typing import Dict, Tuple, List, Optional
-from .image_model import ImageModel
+from .image_model import ImageModel, Precision, PRECISION_DTYPES
 
 
 class GlobalSessionState:
@@ -11,6 +11,8 @@ class GlobalSessionState:
         """Initialize GlobalSessionState with empty image dictionary."""
         self._images: Dict[int, ImageModel] = {}
         self._min_shape: Optional[Tuple[int, ...]] = None
+        self._fft_shape: Optional[Tuple[int, ...]] = None
+        self._precision: Precision = 'double'
     
     def store_image(self, index: int, image_model: ImageModel) -> None:
         """
@@ -62,6 +64,49 @@ class GlobalSessionState:
         """
         return self._min_shape
     
+    def update_fft_shape(self, shape: Tuple[int, ...]) -> None:
+        """
+        Update the transform shape shared by all images.
+        
+        Args:
+            shape: Unified shape plus any fast-length padding
+        """
+        self._fft_shape = shape
+    
+    def get_fft_shape(self) -> Optional[Tuple[int, ...]]:
+        """
+        Get the transform shape, i.e. the shape of the displayed spectra.
+        
+        Region masks live in this coordinate space. Equals the minimum shape
+        unless fast-length padding is enabled.
+        
+        Returns:
+            Transform shape tuple or None if no images stored
+        """
+        return self._fft_shape if self._fft_shape is not None else self._min_shape
+    
+    def set_precision(self, precision: Precision) -> None:
+        """
+        Set the session-wide spectral precision and apply it to stored images.
+        
+        Args:
+            precision: 'double' (float64/complex128) or 'single' (float32/complex64)
+        """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}")
+        self._precision = precision
+        for image in self._images.values():
+            image.set_precision(precision)
+    
+    def get_precision(self) -> Precision:
+        """
+        Get the session-wide spectral precision.
+        
+        Returns:
+            'double' or 'single'
+        """
+        return self._precision
+    
     def get_image_count(self) -> int:
         """
         Get the number of stored images.
@@ -82,4 +127,5 @@ class GlobalSessionState:
             del self._images[index]
             # Clear min_shape if no images remain
             if not self._images:
-                self._min_shape = None
\ No newline at end of file
+                self._min_shape = None
+                self._fft_shape = None
\ No newline at end of file
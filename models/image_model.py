@@ -2,33 +2,101 @@
 
 import base64
 import io
-import threading
+import itertools
 import numpy as np
 from PIL import Image
-from typing import Tuple, Optional, Literal
+from typing import Tuple, Optional, Literal, Dict
+from .fft_backend import FFTBackend, get_default_backend
+from .shape_cache import ShapeCache
+from .rw_lock import ReadWriteLock
+
+Precision = Literal['double', 'single']
+ResizeMethod = Literal['lanczos', 'spectral']
+ComponentType = Literal['magnitude', 'phase', 'real', 'imag']
+
+# Symmetry of each component of a real image's spectrum: X(-k) = conj(X(k)),
+# so magnitude and real part are even while phase and imaginary part are odd.
+COMPONENT_PARITY: Dict[str, int] = {'magnitude': 1, 'real': 1, 'phase': -1, 'imag': -1}
+
+# (real dtype, complex dtype) used for the spectral pipeline at each precision.
+# Single precision keeps the reconstructed 8-bit output within well under one
+# gray level of the double path: the FFT round trip has a relative error of
+# roughly 1e-7 * log2(H * W), amplified in mag/phase mode by the phase weights.
+# At 3840x2160 the worst-case deviation before clipping is about 0.01 gray
+# levels, far below the 0.5 needed to change an 8-bit pixel.
+PRECISION_DTYPES: Dict[str, Tuple[type, type]] = {
+    'double': (np.float64, np.complex128),
+    'single': (np.float32, np.complex64),
+}
+
+# Process-wide source of data versions, so a version never repeats across images
+_version_counter = itertools.count(1)
 
 
 class ImageModel:
     """Represents an individual image and its data."""
 
-    def __init__(self):
-        """Initialize ImageModel with empty data and thread lock."""
-        # Store ORIGINAL image data separately to allow resizing back to larger sizes
+    # Working-set size of one block when deriving components from the spectrum
+    _CHUNK_BYTES = 256 * 1024
+
+    # Entries at the loaded image's size that the default shape cache budget holds
+    _SHAPE_CACHE_ENTRIES = 3
+
+    def __init__(self, precision: Precision = 'double', fft_backend: Optional[FFTBackend] = None,
+                 shape_cache_bytes: Optional[int] = None):
+        """
+        Initialize ImageModel with empty data and thread lock.
+
+        Args:
+            precision: 'double' (float64/complex128) or 'single' (float32/complex64)
+            fft_backend: Backend for the forward FFT (defaults to the shared backend)
+            shape_cache_bytes: Byte budget of the per-shape LRU of resized pixels
+                               and spectra (0 disables it). None sizes it on every
+                               load for _SHAPE_CACHE_ENTRIES entries of the image.
+        """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}")
+        self._precision: Precision = precision
+        self._fft_backend = fft_backend or get_default_backend()
+
+        # Store ORIGINAL image data separately to allow resizing back to larger sizes.
+        # Pixels are 8-bit grayscale and stay uint8; they are only promoted to
+        # float inside the FFT step.
         self._original_raw_pixels: Optional[np.ndarray] = None
         
-        # Working copy that gets resized
+        # Spectrum of the ORIGINAL pixels, kept once computed so 'spectral'
+        # resizes are a crop of it instead of a resample plus a fresh FFT
+        self._original_half_spectrum: Optional[np.ndarray] = None
+
+        # Working copy that gets resized. After a 'spectral' resize this stays
+        # None until the pixels are needed, then is synthesized from the spectrum.
         self._ndarray_raw_pixels: Optional[np.ndarray] = None
-        self._ndarray_complex_arr: Optional[np.ndarray] = None
         self.shape: Tuple[int, ...] = ()
 
-        # Caching attributes
-        self._ndarray_cached_magnitude: Optional[np.ndarray] = None
-        self._ndarray_cached_phase: Optional[np.ndarray] = None
-        self._ndarray_cached_real: Optional[np.ndarray] = None
-        self._ndarray_cached_imag: Optional[np.ndarray] = None
+        # Transform shape: the working shape, or a larger fast FFT size that the
+        # pixels are zero-padded to (bottom/right) before the FFT
+        self.fft_shape: Tuple[int, ...] = ()
+        self._resize_method: ResizeMethod = 'lanczos'
 
-        # Thread safety lock
-        self._lock = threading.Lock()
+        # Working states of recently used shapes, so resizing back is a lookup
+        self._shape_cache_bytes = shape_cache_bytes
+        self._shape_cache = ShapeCache(shape_cache_bytes or 0)
+
+        # Half spectrum of the working pixels: unshifted rfft2 output of shape
+        # (H, W // 2 + 1) at fft_shape. The other half is implied by Hermitian symmetry.
+        self._ndarray_half_spectrum: Optional[np.ndarray] = None
+
+        # Caching attributes: components of the half spectrum (used for mixing)
+        # and of the full shifted spectrum (expanded lazily for display)
+        self._half_components: Dict[str, np.ndarray] = {}
+        self._full_components: Dict[str, np.ndarray] = {}
+
+        # Changes whenever the spectrum is invalidated; lets MixerEngine key
+        # its caches on image contents without hashing arrays
+        self._version: int = next(_version_counter)
+
+        # Thread safety: shared for cache hits, exclusive for computing and invalidating
+        self._lock = ReadWriteLock()
 
     def load_from_contents(self, base64_string: str) -> None:
         """
@@ -45,13 +113,17 @@ class ImageModel:
             if image.mode != 'L':
                 image = image.convert('L')
 
-            with self._lock:
+            with self._lock.write_lock():
                 # Store ORIGINAL data (never modified)
-                self._original_raw_pixels = np.array(image, dtype=np.float64)
-                
-                # Also set working copy
-                self._ndarray_raw_pixels = self._original_raw_pixels.copy()
+                self._original_raw_pixels = self._freeze(np.array(image, dtype=np.uint8))
+
+                # Working copy is a read-only view until the first resize replaces it
+                self._ndarray_raw_pixels = self._original_raw_pixels
+                self._original_half_spectrum = None
+                self._shape_cache.clear()
+                self._size_shape_cache()
                 self.shape = self._ndarray_raw_pixels.shape
+                self.fft_shape = self.shape
 
                 # Reset cached data
                 self._reset_cache()
@@ -59,64 +131,270 @@ class ImageModel:
         except Exception as e:
             raise Exception(f"Error loading image: {e}")
 
-    def resize(self, target_shape: Tuple[int, ...]) -> None:
+    def resize(self, target_shape: Tuple[int, ...], fft_shape: Optional[Tuple[int, ...]] = None,
+               method: ResizeMethod = 'lanczos') -> None:
         """
         Resize the image to a target shape (Thread-Safe).
         Always resizes from ORIGINAL data to avoid quality degradation.
+
+        Args:
+            target_shape: Visible (height, width) of the working pixels
+            fft_shape: Optional transform shape >= target_shape; the pixels are
+                       zero-padded to it before the FFT. Defaults to target_shape.
+            method: 'lanczos' resamples the pixels with PIL and recomputes the FFT.
+                    'spectral' crops the centered spectrum of the original to the
+                    target shape instead (shrinking only; the pixels are then
+                    synthesized lazily from the cropped spectrum).
         """
-        with self._lock:
+        target_shape = tuple(target_shape)
+        fft_shape = tuple(fft_shape) if fft_shape is not None else target_shape
+        if fft_shape[0] < target_shape[0] or fft_shape[1] < target_shape[1]:
+            raise ValueError(f"fft_shape {fft_shape} is smaller than target shape {target_shape}")
+        if method not in ('lanczos', 'spectral'):
+            raise ValueError(f"Unknown resize method: {method}")
+
+        with self._lock.write_lock():
             if self._original_raw_pixels is None:
                 return
 
-            # Always resize from ORIGINAL, not from current resized version
-            # This allows "growing back" to larger sizes
-            image = Image.fromarray(self._original_raw_pixels.astype(np.uint8))
-            image = image.resize((target_shape[1], target_shape[0]), Image.Resampling.LANCZOS)
+            target_key = self._shape_cache_key(target_shape, fft_shape, method)
+            current_key = self._shape_cache_key(self.shape, self.fft_shape, self._resize_method)
+            if target_key == current_key:
+                return
+
+            # Keep the outgoing state, then try to restore the target one
+            self._stash_working_state(current_key)
+            previous_method = self._resize_method
+            self._resize_method = method
+
+            cached = self._shape_cache.get(target_key)
+            if cached is not None:
+                self._reset_cache()
+                pixels, spectrum = cached
+                self._ndarray_raw_pixels = pixels if pixels is not None else self._original_if_shape(target_shape)
+                self._ndarray_half_spectrum = spectrum
+                self.shape = target_shape
+                self.fft_shape = fft_shape
+                return
+
+            original_shape = self._original_raw_pixels.shape
+            is_shrink = target_shape[0] <= original_shape[0] and target_shape[1] <= original_shape[1]
+
+            if target_shape == original_shape:
+                self._ndarray_raw_pixels = self._original_raw_pixels
+                self._reset_cache()
+
+            elif method == 'spectral' and is_shrink:
+                cropped = self._spectral_crop(self._get_original_half_spectrum(), original_shape, target_shape)
+                self._reset_cache()
+                self._ndarray_raw_pixels = None
+                if fft_shape == target_shape:
+                    self._ndarray_half_spectrum = self._freeze(cropped)
+                else:
+                    # Padding changes the spectrum, so go through the pixels
+                    self._ndarray_raw_pixels = self._synthesize_pixels(cropped, target_shape)
+
+            elif (target_shape != tuple(self.shape) or self._ndarray_raw_pixels is None
+                  or (method != previous_method and self._ndarray_raw_pixels is not self._original_raw_pixels)):
+                # Always resize from ORIGINAL, not from current resized version
+                # This allows "growing back" to larger sizes
+                image = Image.fromarray(self._original_raw_pixels)
+                image = image.resize((target_shape[1], target_shape[0]), Image.Resampling.LANCZOS)
+
+                # Update working pixels
+                self._ndarray_raw_pixels = self._freeze(np.array(image, dtype=np.uint8))
+                self._reset_cache()
+
+            else:
+                # Only the padding changed (same method, or original pixels):
+                # keep the pixels, recompute the spectrum
+                self._reset_cache()
 
-            # Update working pixels and shape
-            self._ndarray_raw_pixels = np.array(image, dtype=np.float64)
             self.shape = target_shape
+            self.fft_shape = fft_shape
 
-            # Reset cached data
-            self._reset_cache()
+    def set_precision(self, precision: Precision) -> None:
+        """
+        Switch the spectral precision, dropping cached components (Thread-Safe).
+
+        Args:
+            precision: 'double' or 'single'
+        """
+        if precision not in PRECISION_DTYPES:
+            raise ValueError(f"Unknown precision: {precision}")
+        with self._lock.write_lock():
+            if precision != self._precision:
+                self._precision = precision
+                self._original_half_spectrum = None
+                self._shape_cache.clear()
+                self._size_shape_cache()
+                self._get_pixels()
+                self._reset_cache()
+
+    def get_precision(self) -> Precision:
+        """
+        Get the spectral precision of this image.
+
+        Returns:
+            'double' or 'single'
+        """
+        return self._precision
+
+    def get_version(self) -> int:
+        """
+        Get the data version of this image.
+
+        Returns:
+            Process-wide unique integer that changes on every load, resize or
+            precision change (i.e. whenever the spectrum may differ)
+        """
+        return self._version
+
+    def get_shape_cache_stats(self) -> Dict[str, int]:
+        """
+        Get statistics of the per-shape LRU cache (Thread-Safe).
 
-    def get_data(self, component_type: Literal['raw', 'magnitude', 'phase', 'real', 'imag']) -> np.ndarray:
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses, evictions
+            and rejected (states too large for the budget, never cached)
+        """
+        with self._lock.read_lock():
+            return self._shape_cache.get_stats()
+
+    def get_data(self, component_type: Literal['raw', 'magnitude', 'phase', 'real', 'imag'],
+                 copy: bool = False) -> np.ndarray:
         """
         Retrieve specific scientific data based on component type (Thread-Safe).
+
+        'raw' returns the uint8 working pixels. Spectral components are
+        returned for the full, shifted spectrum (DC at the center) of shape
+        fft_shape, expanded lazily from the half spectrum.
+
+        Cache hits only take the shared read lock, so concurrent renders and
+        mixes do not serialize; a miss retries under the exclusive write lock.
+
+        Cached arrays are flagged read-only and returned without copying, so
+        callers share one buffer per component. Pass copy=True to get a
+        private writable array when the result is going to be mutated.
+
+        Args:
+            component_type: Type of component to retrieve
+            copy: If True, return a writable copy instead of the read-only view
+
+        Returns:
+            Read-only view of the cached component, or a writable copy
         """
-        with self._lock:
-            if self._ndarray_raw_pixels is None:
+        with self._lock.read_lock():
+            if self._original_raw_pixels is None:
                 raise ValueError("No image data loaded")
+            data = self._lookup_full(component_type)
+
+        if data is None:
+            with self._lock.write_lock():
+                if self._original_raw_pixels is None:
+                    raise ValueError("No image data loaded")
+
+                if component_type == 'raw':
+                    data = self._get_pixels()
+                else:
+                    data = self._full_components.get(component_type)
+                    if data is None:
+                        half = self._get_half_component(component_type)
+                        parity = COMPONENT_PARITY[component_type]
+                        data = self._freeze(self._expand_half(half, self.fft_shape[1], parity))
+                        self._full_components[component_type] = data
+
+        return data.copy() if copy else data
+
+    def get_half_data(self, component_type: ComponentType, copy: bool = False) -> np.ndarray:
+        """
+        Retrieve a component of the half spectrum (Thread-Safe).
 
-            if component_type == 'raw':
-                return self._ndarray_raw_pixels.copy()
+        The half spectrum is the unshifted rfft2 layout of shape (H, W // 2 + 1).
+        This is what MixerEngine mixes; the missing half follows from symmetry.
+
+        Args:
+            component_type: 'magnitude', 'phase', 'real' or 'imag'
+            copy: If True, return a writable copy instead of the read-only view
 
-            # Compute FFT if not already computed
-            if self._ndarray_complex_arr is None:
-                self._compute_fft()
+        Returns:
+            Read-only view of the cached half component, or a writable copy
+        """
+        with self._lock.read_lock():
+            if self._original_raw_pixels is None:
+                raise ValueError("No image data loaded")
+            data = self._half_components.get(component_type)
 
-            if component_type == 'magnitude':
-                if self._ndarray_cached_magnitude is None:
-                    self._ndarray_cached_magnitude = np.abs(self._ndarray_complex_arr)
-                return self._ndarray_cached_magnitude.copy()
+        if data is None:
+            with self._lock.write_lock():
+                if self._original_raw_pixels is None:
+                    raise ValueError("No image data loaded")
+                data = self._get_half_component(component_type)
 
-            elif component_type == 'phase':
-                if self._ndarray_cached_phase is None:
-                    self._ndarray_cached_phase = np.angle(self._ndarray_complex_arr)
-                return self._ndarray_cached_phase.copy()
+        return data.copy() if copy else data
 
-            elif component_type == 'real':
-                if self._ndarray_cached_real is None:
-                    self._ndarray_cached_real = np.real(self._ndarray_complex_arr)
-                return self._ndarray_cached_real.copy()
+    def fill_half_component(self, component_type: ComponentType, out: np.ndarray) -> None:
+        """
+        Write a half spectrum component into out and keep out as this image's copy (Thread-Safe).
 
-            elif component_type == 'imag':
-                if self._ndarray_cached_imag is None:
-                    self._ndarray_cached_imag = np.imag(self._ndarray_complex_arr)
-                return self._ndarray_cached_imag.copy()
+        Lets ComponentStack hold each component once: the component is derived
+        straight into (or copied into) the caller's layer, and the image's
+        cache becomes a read-only view of it. When out has another dtype than
+        this image's precision it is only filled (cast).
 
+        Args:
+            component_type: 'magnitude', 'phase', 'real' or 'imag'
+            out: Writable array of shape get_half_shape()
+        """
+        with self._lock.write_lock():
+            if self._original_raw_pixels is None:
+                raise ValueError("No image data loaded")
+            if out.dtype != PRECISION_DTYPES[self._precision][0]:
+                np.copyto(out, self._get_half_component(component_type), casting='same_kind')
+                return
+            cached = self._half_components.get(component_type)
+            if cached is None:
+                self._derive_components((component_type,), {component_type: out})
             else:
-                raise ValueError(f"Unknown component type: {component_type}")
+                np.copyto(out, cached)
+                self._half_components[component_type] = self._freeze(out)
+
+    def get_fft_shape(self) -> Tuple[int, ...]:
+        """
+        Get the transform shape (working shape plus any fast-length padding).
+
+        Returns:
+            Tuple of (height, width) of the full spectrum
+        """
+        return self.fft_shape
+
+    def prepare_components(self, component_types: Optional[Tuple[ComponentType, ...]] = None) -> None:
+        """
+        Derive several half spectrum components in a single pass (Thread-Safe).
+
+        Takes the lock once and computes every requested component that is not
+        cached yet in one blocked sweep over the spectrum. Call it right after
+        upload/resize so later get_data/get_half_data calls are cache hits.
+
+        Args:
+            component_types: Components to prepare; defaults to all four
+        """
+        if component_types is None:
+            component_types = tuple(COMPONENT_PARITY)
+
+        with self._lock.write_lock():
+            if self._original_raw_pixels is None:
+                raise ValueError("No image data loaded")
+            self._derive_components(tuple(component_types))
+
+    def get_half_shape(self) -> Tuple[int, int]:
+        """
+        Get the shape of the half spectrum for the current transform size.
+
+        Returns:
+            Tuple of (fft height, fft width // 2 + 1)
+        """
+        return (self.fft_shape[0], self.fft_shape[1] // 2 + 1)
 
     def get_visual_data(self, component_type: str, brightness: float = 0.0, contrast: float = 1.0) -> np.ndarray:
         """
@@ -130,11 +408,14 @@ class ImageModel:
         Returns:
             NumPy array normalized to 0-1 range with adjustments applied.
         """
-        # 1. Get raw data (thread-safe copy)
+        # 1. Get raw data (read-only view; every step below allocates a new array)
         data = self.get_data(component_type)
 
         # 2. Apply Log Transform for spectral components for better visibility
-        if component_type in ['magnitude', 'real', 'imag']:
+        if component_type == 'raw':
+            # Promote the uint8 pixels so the normalization below is in float
+            data = data.astype(np.float64)
+        elif component_type in ['magnitude', 'real', 'imag']:
             # Log transform: log(1 + abs(x))
             data = np.log(np.abs(data) + 1.0)
 
@@ -149,18 +430,209 @@ class ImageModel:
         return np.clip(data, 0, 1)
 
     def _compute_fft(self) -> None:
-        """Private method to compute the FFT and shift zero-frequency to center."""
-        if self._ndarray_raw_pixels is None:
+        """Private method to compute the half spectrum of the working pixels."""
+        if self._get_pixels() is None:
             raise ValueError("No image data to compute FFT")
 
-        # Compute FFT and immediately shift DC component to the center
-        # This matches the Region Selection logic (Inner = Center = Low Freq)
-        self._ndarray_complex_arr = np.fft.fftshift(np.fft.fft2(self._ndarray_raw_pixels))
+        real_dtype, complex_dtype = PRECISION_DTYPES[self._precision]
+
+        # Promote the uint8 pixels only here, for the duration of the transform.
+        # Pixels are real, so rfft2 holds all the information in half the space.
+        # The spectrum stays unshifted; get_data shifts the DC to the center
+        # when expanding for display (Inner = Center = Low Freq).
+        spectrum = self._fft_backend.rfft2(self._ndarray_raw_pixels.astype(real_dtype, copy=False),
+                                           s=self.fft_shape)
+        self._ndarray_half_spectrum = self._freeze(spectrum.astype(complex_dtype, copy=False))
+
+    def _lookup_full(self, component_type: str) -> Optional[np.ndarray]:
+        """Return cached full-layout data without computing anything (caller holds the read lock)."""
+        if component_type == 'raw':
+            return self._ndarray_raw_pixels
+        if component_type not in COMPONENT_PARITY:
+            raise ValueError(f"Unknown component type: {component_type}")
+        return self._full_components.get(component_type)
+
+    def _shape_cache_key(self, shape: Tuple[int, ...], fft_shape: Tuple[int, ...],
+                         method: ResizeMethod) -> Tuple:
+        """Build the shape cache key; the method is irrelevant at the original shape."""
+        if tuple(shape) == self._original_raw_pixels.shape:
+            method = None
+        return (tuple(shape), tuple(fft_shape), method)
+
+    def _size_shape_cache(self) -> None:
+        """
+        Fit the automatic shape cache budget to the loaded image (caller holds the write lock).
+
+        One state is the uint8 pixels plus the half spectrum at the precision,
+        sized at fast transform lengths so padded states fit too: about 66 MB
+        at 3840x2160 in double precision, far beyond a fixed budget.
+        """
+        if self._shape_cache_bytes is not None or self._original_raw_pixels is None:
+            return
+        height, width = (self._fft_backend.next_fast_len(n) for n in self._original_raw_pixels.shape)
+        complex_size = np.dtype(PRECISION_DTYPES[self._precision][1]).itemsize
+        state_bytes = height * width + height * (width // 2 + 1) * complex_size
+        self._shape_cache.set_max_bytes(self._SHAPE_CACHE_ENTRIES * state_bytes)
+
+    def _stash_working_state(self, key: Tuple) -> None:
+        """Save the current pixels and spectrum in the shape cache (caller holds the write lock)."""
+        # The original pixels are always kept, so there is no need to store them twice
+        pixels = self._ndarray_raw_pixels
+        if pixels is self._original_raw_pixels:
+            pixels = None
+        if pixels is None and self._ndarray_half_spectrum is None:
+            return
+        self._shape_cache.put(key, pixels, self._ndarray_half_spectrum)
+
+    def _original_if_shape(self, shape: Tuple[int, ...]) -> Optional[np.ndarray]:
+        """Return the original pixels if they have the given shape, None otherwise."""
+        if tuple(shape) == self._original_raw_pixels.shape:
+            return self._original_raw_pixels
+        return None
+
+    def _get_original_half_spectrum(self) -> np.ndarray:
+        """Return the cached half spectrum of the original pixels (caller holds the write lock)."""
+        if self._original_half_spectrum is None:
+            real_dtype, complex_dtype = PRECISION_DTYPES[self._precision]
+            spectrum = self._fft_backend.rfft2(self._original_raw_pixels.astype(real_dtype, copy=False))
+            self._original_half_spectrum = self._freeze(spectrum.astype(complex_dtype, copy=False))
+        return self._original_half_spectrum
+
+    def _get_pixels(self) -> np.ndarray:
+        """Return the working pixels, synthesizing them after a spectral resize (caller holds the write lock)."""
+        if self._ndarray_raw_pixels is None and self._ndarray_half_spectrum is not None:
+            self._ndarray_raw_pixels = self._synthesize_pixels(self._ndarray_half_spectrum, self.shape)
+        return self._ndarray_raw_pixels
+
+    def _synthesize_pixels(self, half_spectrum: np.ndarray, shape: Tuple[int, ...]) -> np.ndarray:
+        """Inverse transform a half spectrum back to read-only uint8 pixels."""
+        pixels = self._fft_backend.irfft2(half_spectrum, s=shape)
+        return self._freeze(np.clip(np.rint(pixels), 0, 255).astype(np.uint8))
+
+    @staticmethod
+    def _spectral_crop(half_spectrum: np.ndarray, source_shape: Tuple[int, ...],
+                       target_shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Resample by keeping only the frequencies the target shape can represent.
+
+        Crops the centered spectrum to target_shape, done directly in the
+        unshifted half layout: rows 0..ceil(h/2)-1 and the last h//2 rows, and
+        the first w//2 + 1 columns. The result is rescaled by the ratio of pixel
+        counts so intensities survive the 1/N normalization of the inverse FFT.
+
+        Args:
+            half_spectrum: Half spectrum of the source, shape (H, W // 2 + 1)
+            source_shape: Source (H, W)
+            target_shape: Target (h, w) with h <= H and w <= W
+
+        Returns:
+            New half spectrum of shape (h, w // 2 + 1)
+        """
+        height, width = target_shape
+        top = (height + 1) // 2
+        bottom = height // 2
+
+        cropped = np.empty((height, width // 2 + 1), dtype=half_spectrum.dtype)
+        cropped[:top] = half_spectrum[:top, :width // 2 + 1]
+        if bottom:
+            cropped[top:] = half_spectrum[-bottom:, :width // 2 + 1]
+
+        cropped *= (height * width) / (source_shape[0] * source_shape[1])
+        return cropped
+
+    def _get_half_component(self, component_type: str) -> np.ndarray:
+        """Return a cached half spectrum component, computing it if needed (caller holds the write lock)."""
+        data = self._half_components.get(component_type)
+        if data is None:
+            self._derive_components((component_type,))
+            data = self._half_components[component_type]
+        return data
+
+    def _derive_components(self, component_types: Tuple[str, ...],
+                           outputs: Optional[Dict[str, np.ndarray]] = None) -> None:
+        """
+        Compute the requested half spectrum components in one blocked pass (caller holds the write lock).
+
+        Walks the spectrum in row blocks small enough to stay in cache and
+        writes every requested component for a block before moving on, so the
+        complex data is read from memory once instead of once per component.
+        Components with an array in outputs are written there instead of into
+        a new array.
+        """
+        for component_type in component_types:
+            if component_type not in COMPONENT_PARITY:
+                raise ValueError(f"Unknown component type: {component_type}")
+
+        missing = [c for c in dict.fromkeys(component_types) if c not in self._half_components]
+        if not missing:
+            return
+
+        if self._ndarray_half_spectrum is None:
+            self._compute_fft()
+
+        spectrum = self._ndarray_half_spectrum
+        real_dtype = spectrum.real.dtype
+        outputs = {c: outputs[c] if outputs and c in outputs else np.empty(spectrum.shape, dtype=real_dtype)
+                   for c in missing}
+
+        row_bytes = max(1, spectrum.shape[1] * spectrum.itemsize)
+        chunk_rows = max(1, self._CHUNK_BYTES // row_bytes)
+
+        for start in range(0, spectrum.shape[0], chunk_rows):
+            rows = slice(start, start + chunk_rows)
+            block = spectrum[rows]
+            for component_type, out in outputs.items():
+                if component_type == 'magnitude':
+                    np.abs(block, out=out[rows])
+                elif component_type == 'phase':
+                    np.arctan2(block.imag, block.real, out=out[rows])
+                elif component_type == 'real':
+                    np.copyto(out[rows], block.real)
+                else:
+                    np.copyto(out[rows], block.imag)
+
+        for component_type, out in outputs.items():
+            self._half_components[component_type] = self._freeze(out)
+
+    @staticmethod
+    def _expand_half(half: np.ndarray, width: int, parity: int) -> np.ndarray:
+        """
+        Expand a half spectrum component to the full, shifted layout.
+
+        Uses X(-k0, -k1) = conj(X(k0, k1)): the missing columns are the stored
+        ones mirrored in both axes, negated for odd (parity=-1) components.
+
+        Args:
+            half: Component of shape (H, width // 2 + 1), unshifted
+            width: Width of the full spectrum
+            parity: 1 for even components (magnitude, real), -1 for odd ones (phase, imag)
+
+        Returns:
+            Full component of shape (H, width) with the DC term at the center
+        """
+        half_width = half.shape[1]
+        n_mirror = width - half_width
+
+        full = np.empty((half.shape[0], width), dtype=half.dtype)
+        full[:, :half_width] = half
+        if n_mirror > 0:
+            # Column W - k1 for k1 = half_width..W-1, row -k0 (mod H)
+            full[0, half_width:] = half[0, n_mirror:0:-1]
+            full[1:, half_width:] = half[:0:-1, n_mirror:0:-1]
+            if parity < 0:
+                np.negative(full[:, half_width:], out=full[:, half_width:])
+
+        return np.fft.fftshift(full)
+
+    @staticmethod
+    def _freeze(array: np.ndarray) -> np.ndarray:
+        """Mark an array read-only so cached data can be shared without copying."""
+        array.flags.writeable = False
+        return array
 
     def _reset_cache(self) -> None:
         """Reset all cached data."""
-        self._ndarray_complex_arr = None
-        self._ndarray_cached_magnitude = None
-        self._ndarray_cached_phase = None
-        self._ndarray_cached_real = None
-        self._ndarray_cached_imag = None
\ No newline at end of file
+        self._version = next(_version_counter)
+        self._ndarray_half_spectrum = None
+        self._half_components = {}
+        self._full_components = {}
\ No newline at end of file
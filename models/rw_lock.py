@@ -0,0 +1,56 @@
+"""ReadWriteLock class allowing concurrent readers and exclusive writers."""
+
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    Reader-writer lock with writer preference.
+
+    Any number of threads may hold the read side at once; the write side is
+    exclusive. New readers wait while a writer is waiting, so invalidation
+    (resize, reload) cannot be starved by a steady stream of renders.
+    Neither side is reentrant, and a reader must release before writing.
+    """
+
+    def __init__(self):
+        """Initialize ReadWriteLock with no holders."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer_active = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the with-block."""
+        with self._condition:
+            while self._writer_active or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if self._readers == 0:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the lock exclusively for the duration of the with-block."""
+        with self._condition:
+            self._writers_waiting += 1
+            try:
+                while self._writer_active or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer_active = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_active = False
+                self._condition.notify_all()
@@ -0,0 +1,128 @@
+"""ShapeCache class for keeping resized pixels and spectra of recently used shapes."""
+
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import numpy as np
+
+CacheEntry = Tuple[Optional[np.ndarray], Optional[np.ndarray]]
+
+
+class ShapeCache:
+    """
+    Bounded LRU of (pixels, half spectrum) pairs keyed by target shape.
+
+    Used by ImageModel so that flip-flopping between a few unified shapes
+    (upload a small image, replace it with a larger one, ...) restores the
+    previous working state instead of resampling and re-running the FFT.
+    Not thread-safe on its own; ImageModel only touches it under its lock.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize ShapeCache.
+
+        Args:
+            max_bytes: Byte budget across all entries; least recently used
+                       entries are evicted beyond it. 0 disables the cache.
+        """
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejected = 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up an entry and mark it most recently used.
+
+        Args:
+            key: Cache key (target shape, transform shape, resize method)
+
+        Returns:
+            Tuple of (pixels, half spectrum), either of which may be None, or None on a miss
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, key: Hashable, pixels: Optional[np.ndarray], spectrum: Optional[np.ndarray]) -> None:
+        """
+        Store an entry, evicting least recently used ones to stay within budget.
+
+        An entry larger than the whole budget is not stored (counted as rejected).
+
+        Args:
+            key: Cache key
+            pixels: Read-only working pixels, or None if they can be rebuilt
+            spectrum: Read-only half spectrum, or None if not computed
+        """
+        self._discard(key)
+
+        size = self._entry_bytes((pixels, spectrum))
+        if size == 0:
+            return
+        if size > self._max_bytes:
+            self._rejected += 1
+            return
+
+        self._entries[key] = (pixels, spectrum)
+        self._bytes += size
+        self._evict()
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        """
+        Change the byte budget, evicting least recently used entries beyond it.
+
+        Args:
+            max_bytes: New budget (0 disables the cache)
+        """
+        self._max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Drop every entry (statistics are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses, evictions
+            and rejected (entries too large for the budget)
+        """
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'max_bytes': self._max_bytes,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'rejected': self._rejected
+        }
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the budget is met."""
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= self._entry_bytes(evicted)
+            self._evictions += 1
+
+    def _discard(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= self._entry_bytes(entry)
+
+    @staticmethod
+    def _entry_bytes(entry: CacheEntry) -> int:
+        """Total size of the arrays in an entry."""
+        return sum(array.nbytes for array in entry if array is not None)
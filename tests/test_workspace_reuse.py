@@ -0,0 +1,51 @@
+"""Steady-state mixing should reuse pooled buffers instead of allocating."""
+
+import base64
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from engine.cancellation import CancellationToken
+from engine.mixer_engine import MixerEngine
+from models.image_model import ImageModel
+
+
+def _image(seed: int) -> ImageModel:
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (48, 64), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format='PNG')
+    image = ImageModel()
+    image.load_from_contents('data:image/png;base64,' + base64.b64encode(buffer.getvalue()).decode())
+    return image
+
+
+@pytest.fixture(scope='module')
+def images():
+    return [_image(seed) for seed in range(3)]
+
+
+@pytest.mark.parametrize('mode', ['mag_phase', 'real_imag'])
+@pytest.mark.parametrize('cancellable', [False, True])
+def test_repeated_mixes_allocate_nothing(images, mode, cancellable):
+    engine = MixerEngine()
+
+    def mix(step: int) -> None:
+        token = CancellationToken() if cancellable else None
+        result = engine.mix_images_unified(mode, {0: 1.0, 1: 0.1 * (step % 3)}, {1: 1.0, 2: 0.2 * (step % 2)},
+                                           images, cancel_token=token)
+        engine.release_result(result)
+
+    # Warm up: the pool grows to the working set of a few mixes
+    for step in range(8):
+        mix(step)
+    allocations = engine.get_workspace_stats()['allocations']
+
+    mix(7)
+    assert engine.get_workspace_stats()['allocations'] == allocations, "identical mix allocated"
+
+    for step in range(8, 20):
+        mix(step)
+    assert engine.get_workspace_stats()['allocations'] == allocations, "changing weights allocated"
@@ -806,7 +806,7 @@ class Callbacks:
 
             # --- Apply Persistent Mask ---
             region_info = self.controller.get_region_info()
-            mask_shapes = self._get_mask_shapes(region_info, result.get('unified_shape'))
+            mask_shapes = self._get_mask_shapes(region_info, result.get('spectrum_shape'))
 
             raw_fig = go.Figure(data=go.Heatmap(z=raw_image_data, colorscale='gray', showscale=False, hoverinfo='skip'))
             raw_fig.update_layout(
@@ -860,8 +860,8 @@ class Callbacks:
             outputs = []
 
             region_info = self.controller.get_region_info()
-            unified_shape = self.controller.get_session().get_min_shape()
-            mask_shapes = self._get_mask_shapes(region_info, unified_shape)
+            spectrum_shape = self.controller.get_session().get_fft_shape()
+            mask_shapes = self._get_mask_shapes(region_info, spectrum_shape)
 
             for card_id in range(1, 5):
                 # Skip the card that just uploaded (it already updated itself)
@@ -929,8 +929,8 @@ class Callbacks:
                                                                  'padding': '20px'})
 
             region_info = self.controller.get_region_info()
-            unified_shape = self.controller.get_session().get_min_shape()
-            mask_shapes = self._get_mask_shapes(region_info, unified_shape)
+            spectrum_shape = self.controller.get_session().get_fft_shape()
+            mask_shapes = self._get_mask_shapes(region_info, spectrum_shape)
 
             ft_fig = go.Figure(
                 data=go.Heatmap(z=ft_component_data, colorscale='Viridis', showscale=False, hoverinfo='skip'))
@@ -1005,12 +1005,16 @@ class Callbacks:
             self.controller.handle_slider_update(weight3 or 0.0, 2, comp3_group)
             self.controller.handle_slider_update(weight4 or 0.0, 3, comp4_group)
 
-            # Trigger the mixing button update
-            self.controller.mix_button_update()
+            # Trigger the mixing button update; a newer job for the same viewport replaces the old one
+            job_id = self.controller.mix_button_update(viewport)
+            if job_id is None:
+                return no_update
 
             # Update job store to indicate job started
+            jobs = dict(job_store.get('jobs') or {})
+            jobs[viewport] = job_id
+            job_store['jobs'] = jobs
             job_store['job_started'] = True
-            job_store['viewport'] = viewport
 
             return job_store
 
@@ -1023,113 +1027,127 @@ class Callbacks:
                            prevent_initial_call=True)
         def update_progress(n_intervals, job_store):
             """
-            Check job progress periodically and update progress bar and outputs.
+            Check the progress of every viewport's job periodically and render finished results.
             """
+            jobs = dict(job_store.get('jobs') or {})
+
             # If no job is running, return ready state
-            if not job_store.get('job_started', False):
+            if not jobs:
                 progress_style = {'width': '0%', 'height': '100%', 'backgroundColor': '#4CAF50', 'borderRadius': '4px',
                                   'transition': 'width 0.3s ease'}
                 return no_update, no_update, progress_style, "Ready", no_update
 
-            # Check if job is still processing
-            if self.controller.is_processing():
-                # Get current progress
-                progress = self.controller.get_job_progress()
+            outputs = {'viewport1': no_update, 'viewport2': no_update}
+            running_progress = []
+            waiting = 0
+            status_text = None
+
+            for viewport, job_id in list(jobs.items()):
+                status = self.controller.get_job_status(job_id)
+
+                # Job is waiting for a worker (the pool is saturated) or processing
+                if status == 'queued':
+                    waiting += 1
+                    continue
+                if status == 'running':
+                    running_progress.append(max(0.0, self.controller.get_job_progress(job_id)))
+                    continue
+
+                del jobs[viewport]
+                if status == 'cancelled':
+                    continue
+                if status == 'rejected':
+                    outputs[viewport] = self._error_display("Server busy: too many mixes queued, try again")
+                    status_text = "Busy"
+                    continue
+
+                # Job is complete - get result (None after an error, or once the result expired)
+                result = self.controller.get_job_result(job_id)
+                if result is None:
+                    outputs[viewport] = self._error_display("Error: No mixed result available")
+                    status_text = "Error"
+                else:
+                    outputs[viewport] = self._mixed_result_display(result)
+                    status_text = status_text or "Complete - 100%"
+
+            # Update job store with the jobs still pending
+            job_store['jobs'] = jobs
+            job_store['job_started'] = bool(jobs)
 
+            if running_progress:
                 # Round progress to nearest 10% increment for smoother visual updates
-                progress_percent = int(progress * 100)
+                progress_percent = int(min(running_progress) * 100)
                 display_percent = (progress_percent // 10) * 10
                 progress_style = {'width': f'{display_percent}%', 'height': '100%', 'backgroundColor': '#4CAF50',
                                   'borderRadius': '4px', 'transition': 'width 0.3s ease'}
-                return no_update, no_update, progress_style, f"Processing... {display_percent}%", no_update
-
-            # Job is complete - get result
-            result = self.controller.get_job_result()
-            viewport = job_store.get('viewport', 'viewport1')
-
-            # Reset job store
-            job_store['job_started'] = False
-            job_store['viewport'] = None
-
-            # Set progress bar to 100% when complete
-            progress_style = {
-                'width': '100%',
-                'height': '100%',
-                'backgroundColor': '#4CAF50',
-                'borderRadius': '4px',
-                'transition': 'width 0.3s ease'
-            }
-
-            if result is None:
-                # Error or no result
-                error_div = html.Div([
-                    html.Div("Error: No mixed result available", style={
-                        'color': 'red',
-                        'textAlign': 'center',
-                        'padding': '20px',
-                        'fontSize': '14px'
-                    })
-                ])
-
-                if viewport == 'viewport1':
-                    return error_div, no_update, progress_style, "Error", job_store
-                else:
-                    return no_update, error_div, progress_style, "Error", job_store
-
-            # Create display for the mixed image
-            try:
-                # Convert to numpy array if needed
-                if isinstance(result, np.ndarray):
-                    mixed_data = result
-                elif isinstance(result, list):
-                    mixed_data = np.array(result)
-                else:
-                    mixed_data = result
-
-                mixed_fig = go.Figure(data=go.Heatmap(
-                    z=mixed_data,
-                    colorscale='gray',
-                    showscale=False,
-                    hoverinfo='skip'
-                ))
-                mixed_fig.update_layout(
-                    xaxis={'visible': False, 'showgrid': False},
-                    yaxis={'visible': False, 'showgrid': False, 'autorange': 'reversed'},
-                    margin=dict(l=0, r=0, t=0, b=0),
-                    paper_bgcolor='#0f0f0f',
-                    plot_bgcolor='#0f0f0f',
-                    autosize=True
+                status_text = f"Processing... {display_percent}%"
+                if waiting:
+                    status_text += f" ({waiting} queued)"
+            elif waiting:
+                progress_style = {'width': '0%', 'height': '100%', 'backgroundColor': '#4CAF50', 'borderRadius': '4px',
+                                  'transition': 'width 0.3s ease'}
+                status_text = "Queued..."
+            else:
+                # Set progress bar to 100% when complete
+                progress_style = {
+                    'width': '100%',
+                    'height': '100%',
+                    'backgroundColor': '#4CAF50',
+                    'borderRadius': '4px',
+                    'transition': 'width 0.3s ease'
+                }
+                status_text = status_text or "Ready"
+
+            return outputs['viewport1'], outputs['viewport2'], progress_style, status_text, job_store
+
+    def _error_display(self, message):
+        """Build the error placeholder shown in an output viewport."""
+        return html.Div([
+            html.Div(message, style={
+                'color': 'red',
+                'textAlign': 'center',
+                'padding': '20px',
+                'fontSize': '14px'
+            })
+        ])
+
+    def _mixed_result_display(self, result):
+        """Build the output viewport contents for a mixed image."""
+        try:
+            # Convert to numpy array if needed
+            if isinstance(result, np.ndarray):
+                mixed_data = result
+            elif isinstance(result, list):
+                mixed_data = np.array(result)
+            else:
+                mixed_data = result
+
+            mixed_fig = go.Figure(data=go.Heatmap(
+                z=mixed_data,
+                colorscale='gray',
+                showscale=False,
+                hoverinfo='skip'
+            ))
+            mixed_fig.update_layout(
+                xaxis={'visible': False, 'showgrid': False},
+                yaxis={'visible': False, 'showgrid': False, 'autorange': 'reversed'},
+                margin=dict(l=0, r=0, t=0, b=0),
+                paper_bgcolor='#0f0f0f',
+                plot_bgcolor='#0f0f0f',
+                autosize=True
+            )
+            mixed_fig.update_yaxes(scaleanchor="x", scaleratio=1)
+
+            return html.Div([
+                dcc.Graph(
+                    figure=mixed_fig,
+                    config={'displayModeBar': False},
+                    style={'height': '100%', 'width': '100%'}
                 )
-                mixed_fig.update_yaxes(scaleanchor="x", scaleratio=1)
-
-                mixed_display = html.Div([
-                    dcc.Graph(
-                        figure=mixed_fig,
-                        config={'displayModeBar': False},
-                        style={'height': '100%', 'width': '100%'}
-                    )
-                ], style={'height': '100%', 'width': '100%'})
-
-                # Show 100% complete
-                if viewport == 'viewport1':
-                    return mixed_display, no_update, progress_style, "Complete - 100%", job_store
-                else:
-                    return no_update, mixed_display, progress_style, "Complete - 100%", job_store
-
-            except Exception as e:
-                error_div = html.Div([
-                    html.Div(f"Display error: {str(e)}", style={
-                        'color': 'red',
-                        'textAlign': 'center',
-                        'padding': '20px',
-                        'fontSize': '14px'
-                    })
-                ])
-
-                if viewport == 'viewport1':
-                    return error_div, no_update, progress_style, "Error", job_store
-                else:
-                    return no_update, error_div, progress_style, "Error", job_store
+            ], style={'height': '100%', 'width': '100%'})
+
+        except Exception as e:
+            return self._error_display(f"Display error: {str(e)}")
 
     # --- RECT UPDATE CALLBACK: HANDLES SYNC AND REMOVAL ---
     # def _rect_update_callback(self):
@@ -1235,8 +1253,8 @@ class Callbacks:
             # UPDATE ALL FIGURES VISUALLY
             # Get the definitive state from the backend (which is now correct)
             region_info = self.controller.get_region_info()
-            unified_shape = self.controller.get_session().get_min_shape()
-            mask_shapes = self._get_mask_shapes(region_info, unified_shape)
+            spectrum_shape = self.controller.get_session().get_fft_shape()
+            mask_shapes = self._get_mask_shapes(region_info, spectrum_shape)
 
             new_figures = []
             for fig in current_figures:
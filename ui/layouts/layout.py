@@ -994,7 +994,7 @@ class Layout:
                 id='job-store',
                 data={
                     'job_started': False,
-                    'viewport': None,
+                    'jobs': {},
                     'progress': 0.0
                 }
             ),
@@ -2,6 +2,7 @@
 
 from .unit_unificator import UnitUnificator
 from .region_handler import RegionHandler
+from .region_mask import RegionMask
 
-__all__ = ['UnitUnificator', 'RegionHandler']
+__all__ = ['UnitUnificator', 'RegionHandler', 'RegionMask']
 
@@ -2,6 +2,7 @@
 
 import numpy as np
 from typing import Tuple, Optional, Dict, Any
+from .region_mask import RegionMask
 
 
 class RegionHandler:
@@ -142,36 +143,28 @@ class RegionHandler:
             >>> # Select everything EXCEPT center (high frequencies)
             >>> mask = handler.create_mask((200, 200), (50, 50, 150, 150), is_inner=False)
         """
-        # If no rectangle specified, select everything
-        if rect_coords is None:
-            return np.ones(shape, dtype=np.float64)
-        
-        x1, y1, x2, y2 = rect_coords
-        
-        # Ensure coordinates are within bounds
-        x1 = max(0, min(x1, shape[1] - 1))
-        y1 = max(0, min(y1, shape[0] - 1))
-        x2 = max(0, min(x2, shape[1] - 1))
-        y2 = max(0, min(y2, shape[0] - 1))
-        
-        # Ensure x1 < x2 and y1 < y2
-        if x1 > x2:
-            x1, x2 = x2, x1
-        if y1 > y2:
-            y1, y2 = y2, y1
-        
-        if is_inner:
-            # Inner mask: 1 inside rectangle, 0 outside
-            # Start with all zeros, then set rectangle to 1
-            mask = np.zeros(shape, dtype=np.float64)
-            mask[y1:y2+1, x1:x2+1] = 1.0
-        else:
-            # Outer mask: 0 inside rectangle, 1 outside
-            # Start with all ones, then set rectangle to 0
-            mask = np.ones(shape, dtype=np.float64)
-            mask[y1:y2+1, x1:x2+1] = 0.0
-        
-        return mask
+        return self.create_region_mask(shape, rect_coords, is_inner).to_dense()
+    
+    def create_region_mask(self, shape: Tuple[int, int], rect_coords: Optional[Tuple[int, int, int, int]] = None, is_inner: bool = True) -> RegionMask:
+        """
+        Create a compact mask: the rectangle and mode, without a dense array.
+        
+        Same selection as create_mask, but MixerEngine applies it by writing
+        only the blocks of the spectrum the rectangle touches.
+        
+        Args:
+            shape: Shape of the mask (height, width)
+            rect_coords: Optional tuple of (x1, y1, x2, y2). If None, selects everything.
+            is_inner: True keeps the rectangle (low freq), False keeps the outside (high freq)
+        
+        Returns:
+            RegionMask
+        
+        Example:
+            >>> region = handler.create_region_mask((200, 200), (50, 50, 150, 150), is_inner=True)
+            >>> dense = region.to_dense()  # same as create_mask(...)
+        """
+        return RegionMask.from_rectangle(shape, rect_coords, is_inner)
     
     def get_rectangle_info(self) -> Dict[str, Any]:
         """
@@ -0,0 +1,157 @@
+"""RegionMask class for compact frequency-region masks."""
+
+import hashlib
+import numpy as np
+from typing import Hashable, Optional, Tuple
+
+
+class RegionMask:
+    """
+    A frequency-selection mask that is not stored as a dense float array.
+
+    Rectangular selections (what the UI draws) are kept as the rectangle and
+    the inner/outer flag; arbitrary regions are kept as a boolean array
+    (1 byte per pixel instead of 8). MixerEngine applies a rectangle by
+    writing only the affected blocks of the spectrum, and to_dense() rebuilds
+    the 0/1 float array that RegionHandler.create_mask used to return.
+
+    Instances are immutable, so cache_key() is computed once.
+    """
+
+    def __init__(self, shape: Tuple[int, int],
+                 rect_slices: Optional[Tuple[slice, slice]] = None,
+                 is_inner: bool = True,
+                 region: Optional[np.ndarray] = None):
+        """
+        Initialize RegionMask. Use from_rectangle() or from_array() instead.
+
+        Args:
+            shape: Shape of the mask (height, width), in shifted spectrum coordinates
+            rect_slices: (row slice, column slice) of the rectangle, or None
+            is_inner: True keeps the rectangle, False keeps everything outside it
+            region: Boolean array of the kept pixels (instead of a rectangle)
+        """
+        self.shape = (int(shape[0]), int(shape[1]))
+        self._rect_slices = rect_slices
+        self._is_inner = is_inner
+        self._region = region
+
+        if region is not None:
+            digest = hashlib.blake2b(np.packbits(region).tobytes(), digest_size=16).digest()
+            self._cache_key: Hashable = ('region', self.shape, digest)
+        elif rect_slices is not None:
+            rows, cols = rect_slices
+            self._cache_key = ('rect', self.shape, rows.start, rows.stop, cols.start, cols.stop, is_inner)
+        else:
+            self._cache_key = ('full', self.shape)
+
+    @classmethod
+    def from_rectangle(cls, shape: Tuple[int, int],
+                       rect_coords: Optional[Tuple[int, int, int, int]] = None,
+                       is_inner: bool = True) -> 'RegionMask':
+        """
+        Create a mask from a rectangle, with the same clamping as RegionHandler.create_mask.
+
+        Args:
+            shape: Shape of the mask (height, width)
+            rect_coords: Optional (x1, y1, x2, y2), inclusive. None selects everything.
+            is_inner: True keeps the rectangle (low freq), False keeps the outside (high freq)
+
+        Returns:
+            RegionMask
+        """
+        if rect_coords is None:
+            return cls(shape)
+
+        x1, y1, x2, y2 = rect_coords
+
+        # Ensure coordinates are within bounds
+        x1 = max(0, min(x1, shape[1] - 1))
+        y1 = max(0, min(y1, shape[0] - 1))
+        x2 = max(0, min(x2, shape[1] - 1))
+        y2 = max(0, min(y2, shape[0] - 1))
+
+        # Ensure x1 < x2 and y1 < y2
+        if x1 > x2:
+            x1, x2 = x2, x1
+        if y1 > y2:
+            y1, y2 = y2, y1
+
+        return cls(shape, (slice(int(y1), int(y2) + 1), slice(int(x1), int(x2) + 1)), is_inner)
+
+    @classmethod
+    def from_array(cls, region: np.ndarray) -> 'RegionMask':
+        """
+        Create a mask from an arbitrary region.
+
+        Args:
+            region: Array of shape (height, width); nonzero pixels are kept
+
+        Returns:
+            RegionMask holding a read-only boolean copy of the region
+        """
+        region = np.array(region, dtype=bool)
+        region.flags.writeable = False
+        return cls(region.shape, region=region)
+
+    def get_rect_slices(self) -> Optional[Tuple[slice, slice]]:
+        """
+        Get the rectangle as half-open (row slice, column slice).
+
+        Returns:
+            Slices, or None if this mask is not a rectangle
+        """
+        return self._rect_slices
+
+    def get_region(self) -> Optional[np.ndarray]:
+        """
+        Get the boolean region of an arbitrary-shape mask.
+
+        Returns:
+            Read-only boolean array, or None if this mask is a rectangle or selects everything
+        """
+        return self._region
+
+    def is_inner(self) -> bool:
+        """Check whether a rectangle mask keeps its inside (True) or outside (False)."""
+        return self._is_inner
+
+    def selects_everything(self) -> bool:
+        """Check whether the mask is all ones (applying it is a no-op)."""
+        return self._rect_slices is None and self._region is None
+
+    def cache_key(self) -> Hashable:
+        """
+        Identity of the mask's contents, for memoizing results that depend on it.
+
+        Returns:
+            Hashable key (equal keys mean equal masks)
+        """
+        return self._cache_key
+
+    def get_nbytes(self) -> int:
+        """Get the bytes used to store the mask."""
+        return self._region.nbytes if self._region is not None else 0
+
+    def to_dense(self, dtype: np.dtype = np.float64) -> np.ndarray:
+        """
+        Build the dense 0/1 array.
+
+        Args:
+            dtype: Output dtype
+
+        Returns:
+            Array of shape self.shape
+        """
+        if self._region is not None:
+            return self._region.astype(dtype)
+        if self._rect_slices is None:
+            return np.ones(self.shape, dtype=dtype)
+
+        if self._is_inner:
+            mask = np.zeros(self.shape, dtype=dtype)
+            mask[self._rect_slices] = 1
+        else:
+            mask = np.ones(self.shape, dtype=dtype)
+            mask[self._rect_slices] = 0
+        return mask
@@ -1,13 +1,72 @@
 """UnitUnificator class for ensuring consistent image sizing."""
 
-from typing import List, Tuple
+from typing import List, Tuple, Optional, Literal
 from models.global_session_state import GlobalSessionState
-from models.image_model import ImageModel
+from models.image_model import ImageModel, ResizeMethod
+from models.fft_backend import FFTBackend
+
+FastLengthMode = Optional[Literal['pad', 'crop']]
 
 
 class UnitUnificator:
     """Ensures consistent image sizing across all images in a session."""
     
+    def __init__(self, fast_length_mode: FastLengthMode = None, resize_method: ResizeMethod = 'lanczos'):
+        """
+        Initialize UnitUnificator.
+        
+        Args:
+            fast_length_mode: How to make the transform size FFT-friendly:
+                - None: transform at the unified shape as-is
+                - 'pad': keep the unified shape visible, zero-pad the FFT to the
+                  next 5-smooth size (MixerEngine crops the output back)
+                - 'crop': shrink the unified shape to the previous 5-smooth size
+            resize_method: 'lanczos' (PIL resample + FFT) or 'spectral'
+                           (crop of the original's spectrum, see ImageModel.resize)
+        """
+        self.set_fast_length_mode(fast_length_mode)
+        self.set_resize_method(resize_method)
+    
+    def set_fast_length_mode(self, fast_length_mode: FastLengthMode) -> None:
+        """
+        Set the fast-length mode used by the next enforce_unified_size call.
+        
+        Args:
+            fast_length_mode: None, 'pad' or 'crop'
+        """
+        if fast_length_mode not in (None, 'pad', 'crop'):
+            raise ValueError(f"Unknown fast length mode: {fast_length_mode}")
+        self._fast_length_mode = fast_length_mode
+    
+    def get_fast_length_mode(self) -> FastLengthMode:
+        """
+        Get the current fast-length mode.
+        
+        Returns:
+            None, 'pad' or 'crop'
+        """
+        return self._fast_length_mode
+    
+    def set_resize_method(self, resize_method: ResizeMethod) -> None:
+        """
+        Set how images are shrunk to the unified shape.
+        
+        Args:
+            resize_method: 'lanczos' or 'spectral'
+        """
+        if resize_method not in ('lanczos', 'spectral'):
+            raise ValueError(f"Unknown resize method: {resize_method}")
+        self._resize_method = resize_method
+    
+    def get_resize_method(self) -> ResizeMethod:
+        """
+        Get the current resize method.
+        
+        Returns:
+            'lanczos' or 'spectral'
+        """
+        return self._resize_method
+    
     def enforce_unified_size(self, state: GlobalSessionState) -> None:
         """
         Enforce a unified size across images in the given state.
@@ -22,14 +81,35 @@ class UnitUnificator:
         
         # Always recalculate min dimensions from original image sizes
         min_shape = self._find_min_dimensions(images)
+        min_shape, fft_shape = self._apply_fast_length(min_shape)
         
-        # Update state's min_shape
+        # Update state's min_shape and transform shape
         state.update_min_shape(min_shape)
+        state.update_fft_shape(fft_shape)
         
         # Resize all images to minimum dimensions
         for image in images:
-            if image.shape != min_shape:
-                image.resize(min_shape)
+            if image.shape != min_shape or image.get_fft_shape() != fft_shape:
+                image.resize(min_shape, fft_shape, method=self._resize_method)
+    
+    def _apply_fast_length(self, shape: Tuple[int, int]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """
+        Derive the visible and transform shapes for the current fast-length mode.
+        
+        Args:
+            shape: Unified (height, width) before fast-length adjustment
+        
+        Returns:
+            Tuple of (visible shape, transform shape)
+        """
+        if self._fast_length_mode == 'pad':
+            fft_shape = (FFTBackend.next_fast_len(shape[0]), FFTBackend.next_fast_len(shape[1]))
+            return shape, fft_shape
+        
+        if self._fast_length_mode == 'crop':
+            shape = (FFTBackend.prev_fast_len(shape[0]), FFTBackend.prev_fast_len(shape[1]))
+        
+        return shape, shape
     
     def _find_min_dimensions(self, images: List[ImageModel]) -> Tuple[int, int]:
         """